@@ -11,6 +11,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 import boto3
+from botocore.config import Config
 
 if TYPE_CHECKING:
     from mypy_boto3_acm_pca import ACMPCAClient
@@ -20,12 +21,28 @@ if TYPE_CHECKING:
     from mypy_boto3_ssm import SSMClient
     from mypy_boto3_sts import STSClient
 
+# Connection pool per client; comfortably above the workflows' thread fan-out
+MAX_POOL_CONNECTIONS = 32
+
+# Shared by every client; keeps botocore's default retry behaviour, so a
+# single failing call reports its error promptly.
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+)
+
+# For the CloudFormation client of a concurrent fan-out only. Adaptive
+# retries add client-side rate limiting, so workers back off together
+# instead of tripping API throttles.
+FANOUT_CLIENT_CONFIG = CLIENT_CONFIG.merge(Config(retries={"mode": "adaptive", "max_attempts": 10}))
+
 
 @dataclass
 class AwsContext:
     """AWS session and clients. Created once at CLI entry.
 
-    Clients are lazily initialized on first access via cached_property.
+    Clients are lazily initialized on first access via cached_property,
+    all sharing CLIENT_CONFIG.
 
     Example:
         ctx = AwsContext(region="ap-southeast-2", profile="dev")
@@ -44,32 +61,44 @@ class AwsContext:
     @cached_property
     def cfn(self) -> CloudFormationClient:
         """CloudFormation client."""
-        return self.session.client("cloudformation")
+        return self.session.client("cloudformation", config=CLIENT_CONFIG)
 
     @cached_property
     def s3(self) -> S3Client:
         """S3 client."""
-        return self.session.client("s3")
+        return self.session.client("s3", config=CLIENT_CONFIG)
 
     @cached_property
     def ssm(self) -> SSMClient:
         """SSM Parameter Store client."""
-        return self.session.client("ssm")
+        return self.session.client("ssm", config=CLIENT_CONFIG)
 
     @cached_property
     def secrets(self) -> SecretsManagerClient:
         """Secrets Manager client."""
-        return self.session.client("secretsmanager")
+        return self.session.client("secretsmanager", config=CLIENT_CONFIG)
 
     @cached_property
     def sts(self) -> STSClient:
         """STS client."""
-        return self.session.client("sts")
+        return self.session.client("sts", config=CLIENT_CONFIG)
 
     @cached_property
     def acm_pca(self) -> ACMPCAClient:
         """ACM Private CA client."""
-        return self.session.client("acm-pca")
+        return self.session.client("acm-pca", config=CLIENT_CONFIG)
+
+    def fanout_context(self) -> AwsContext:
+        """A context for concurrent CloudFormation fan-outs.
+
+        Shares this context's session, but its CloudFormation client uses
+        FANOUT_CLIENT_CONFIG. The client is built here, before any worker
+        thread touches it.
+        """
+        fanout = AwsContext(region=self.region, profile=self.profile)
+        fanout.session = self.session
+        fanout.cfn = self.session.client("cloudformation", config=FANOUT_CLIENT_CONFIG)
+        return fanout
 
     @cached_property
     def account_id(self) -> str:
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 from botocore.exceptions import ClientError
 
 from iam_ra_cli.lib.errors import StackDeleteError, StackDeployError
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 
 if TYPE_CHECKING:
     from mypy_boto3_cloudformation import CloudFormationClient
@@ -110,7 +110,7 @@ def delete_stack(
 ) -> Result[None, StackDeleteError]:
     """Delete stack and wait for completion."""
     if not stack_exists(cfn, stack_name):
-        return Ok(None)
+        return ok(None)
 
     try:
         cfn.delete_stack(StackName=stack_name)
@@ -120,7 +120,7 @@ def delete_stack(
     result = wait_for_stack(cfn, stack_name, "DELETE_COMPLETE", timeout_seconds)
     match result:
         case Ok(_):
-            return Ok(None)
+            return ok(None)
         case Err(e):
             return Err(StackDeleteError(stack_name, e.status, e.reason))
 
@@ -148,10 +148,10 @@ def wait_for_stack(
 
         # DELETE_COMPLETE means stack is gone
         if target_status == "DELETE_COMPLETE" and status is None:
-            return Ok(None)
+            return ok(None)
 
         if status == target_status:
-            return Ok(None)
+            return ok(None)
 
         if status in failed_states:
             # Try to get failure reason
@@ -5,6 +5,7 @@ All functions are pure - they generate YAML strings from inputs.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Default values for manifest generation
 DEFAULT_CERT_DURATION_HOURS = 24
@@ -13,6 +14,12 @@ DEFAULT_ISSUER_NAME = "iam-ra"
 DEFAULT_CA_SECRET_NAME = "iam-ra-ca"
 DEFAULT_CERT_SECRET_NAME = "iam-ra-cert"
 
+# Memo size for the pure generators below. They are called with the same
+# handful of names/ARNs over and over (one per workload), so this is plenty.
+# Generators that take CA key material are deliberately not memoized, so
+# private keys never outlive the call in a process-wide cache.
+GENERATOR_CACHE_SIZE = 128
+
 # Public ECR image for aws_signing_helper
 # Users can override this if they want to use their own image
 AWS_SIGNING_HELPER_IMAGE = "public.ecr.aws/rolesanywhere/aws-signing-helper:latest"
@@ -95,6 +102,7 @@ stringData:
 """
 
 
+@lru_cache(maxsize=GENERATOR_CACHE_SIZE)
 def generate_issuer(
     name: str = DEFAULT_ISSUER_NAME,
     namespace: str = "default",
@@ -125,6 +133,7 @@ spec:
 """
 
 
+@lru_cache(maxsize=GENERATOR_CACHE_SIZE)
 def generate_certificate(
     workload_name: str,
     namespace: str = "default",
@@ -176,6 +185,7 @@ spec:
 """
 
 
+@lru_cache(maxsize=GENERATOR_CACHE_SIZE)
 def generate_configmap(
     workload_name: str,
     trust_anchor_arn: str,
@@ -209,6 +219,7 @@ data:
 """
 
 
+@lru_cache(maxsize=GENERATOR_CACHE_SIZE)
 def generate_sample_pod(
     workload_name: str,
     namespace: str = "default",
@@ -11,7 +11,7 @@ Inspired by Rust's Result<T, E>. Use pattern matching to handle results:
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -36,8 +36,21 @@ class Err(Generic[E]):
 type Result[T, E] = Ok[T] | Err[E]
 
 
+# Shared instances for the constant successes most operations return; Ok is
+# frozen, so handing out the same object is safe.
+_OK_NONE: Ok[Any] = Ok(None)
+_OK_TRUE: Ok[Any] = Ok(True)
+_OK_FALSE: Ok[Any] = Ok(False)
+
+
 def ok(value: T) -> Ok[T]:
-    """Create an Ok result."""
+    """Create an Ok result. Ok(None), Ok(True) and Ok(False) are shared."""
+    if value is None:
+        return _OK_NONE
+    if value is True:
+        return _OK_TRUE
+    if value is False:
+        return _OK_FALSE
     return Ok(value)
 
 
@@ -48,30 +61,26 @@ def err(error: E) -> Err[E]:
 
 def is_ok(result: Result[T, E]) -> bool:
     """Check if result is Ok."""
-    return isinstance(result, Ok)
+    return type(result) is Ok
 
 
 def is_err(result: Result[T, E]) -> bool:
     """Check if result is Err."""
-    return isinstance(result, Err)
+    return type(result) is Err
 
 
 def map_ok(result: Result[T, E], f: Callable[[T], U]) -> Result[U, E]:
     """Apply f to the value if Ok, otherwise return the Err unchanged."""
-    match result:
-        case Ok(value):
-            return Ok(f(value))
-        case Err() as e:
-            return e
+    if type(result) is Ok:
+        return Ok(f(result.value))
+    return result
 
 
 def map_err(result: Result[T, E], f: Callable[[E], U]) -> Result[T, U]:
     """Apply f to the error if Err, otherwise return the Ok unchanged."""
-    match result:
-        case Ok() as o:
-            return o
-        case Err(error):
-            return Err(f(error))
+    if type(result) is Err:
+        return Err(f(result.error))
+    return result
 
 
 def flat_map(result: Result[T, E], f: Callable[[T], Result[U, E]]) -> Result[U, E]:
@@ -79,11 +88,9 @@ def flat_map(result: Result[T, E], f: Callable[[T], Result[U, E]]) -> Result[U,
 
     Also known as `and_then` or `bind`.
     """
-    match result:
-        case Ok(value):
-            return f(value)
-        case Err() as e:
-            return e
+    if type(result) is Ok:
+        return f(result.value)
+    return result
 
 
 def unwrap(result: Result[T, E]) -> T:
@@ -91,20 +98,16 @@ def unwrap(result: Result[T, E]) -> T:
 
     Use sparingly - prefer pattern matching.
     """
-    match result:
-        case Ok(value):
-            return value
-        case Err(error):
-            raise ValueError(f"Called unwrap on Err: {error}")
+    if type(result) is Ok:
+        return result.value
+    raise ValueError(f"Called unwrap on Err: {result.error}")
 
 
 def unwrap_or(result: Result[T, E], default: T) -> T:
     """Extract the value from Ok, or return default if Err."""
-    match result:
-        case Ok(value):
-            return value
-        case Err():
-            return default
+    if type(result) is Ok:
+        return result.value
+    return default
 
 
 def unwrap_err(result: Result[T, E]) -> E:
@@ -112,8 +115,6 @@ def unwrap_err(result: Result[T, E]) -> E:
 
     Use sparingly - prefer pattern matching.
     """
-    match result:
-        case Ok(value):
-            raise ValueError(f"Called unwrap_err on Ok: {value}")
-        case Err(error):
-            return error
+    if type(result) is Err:
+        return result.error
+    raise ValueError(f"Called unwrap_err on Ok: {result.value}")
@@ -4,37 +4,75 @@ Flow:
 1. SSM parameter /iam-ra/<namespace>/state-location contains S3 URI
 2. S3 object contains full state JSON
 3. Local cache at ~/.cache/iam-ra/<namespace>/state.json
+
+Within a process, the last JSON loaded or saved per namespace is also
+memoized in memory for up to CACHE_TTL seconds, like the cache file, so
+repeated loads in one CLI command make no AWS calls,
+and save() skips rewriting an SSM pointer it already knows is current, or
+the whole write when the state matches what it last read or wrote there.
+Status polling can opt in (cache_uninitialized=True) to trusting a "not
+initialized" answer for UNINITIALIZED_TTL seconds, so polling an empty
+namespace does not hit SSM every time. Other callers always ask SSM, so
+they see an init run by another process immediately.
+
+Next to the cache file, state.json.etag holds the ETag of the cached body
+and a digest of that body. Once the cache is stale, the S3 GET is made
+conditional on that ETag, so an unchanged state costs a 304 instead of a
+full download. The ETag is only trusted if the digest matches the body on
+disk, so a body and ETag written by different processes are never paired.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import ClientError
 
 from iam_ra_cli.lib import paths
 from iam_ra_cli.lib.errors import (
+    NotInitializedError,
     SSMReadError,
     SSMWriteError,
     StateLoadError,
     StateSaveError,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 from iam_ra_cli.lib.storage import file
-from iam_ra_cli.models import State
+from iam_ra_cli.models import Arn, State
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from mypy_boto3_s3 import S3Client
     from mypy_boto3_ssm import SSMClient
 
 # Cache TTL in seconds (5 minutes)
 CACHE_TTL = 300
 
+# How long an "not initialized" answer is trusted in-process, in seconds
+UNINITIALIZED_TTL = 30
+
 # SSM parameter paths
 SSM_PREFIX = "/iam-ra/{namespace}"
 SSM_STATE_LOCATION = f"{SSM_PREFIX}/state-location"
 
+# In-process memo: namespace -> (ssm, s3, state JSON, monotonic time). Entries
+# only hit for the same client pair within CACHE_TTL; holding the clients
+# keeps their identity stable.
+_memo: dict[str, tuple[object, object, str, float]] = {}
+
+# State location last read from or written to SSM: namespace -> (ssm, S3 URI).
+# save() skips PutParameter when the pointer is already known to match.
+_known_locations: dict[str, tuple[object, str]] = {}
+
+# Namespaces SSM reported as not initialized: namespace -> (ssm, monotonic time)
+_uninitialized: dict[str, tuple[object, float]] = {}
+
 
 def _parse_s3_uri(uri: str) -> tuple[str, str]:
     """Parse s3://bucket/key into (bucket, key)."""
@@ -44,6 +82,79 @@ def _parse_s3_uri(uri: str) -> tuple[str, str]:
     return match.group(1), match.group(2)
 
 
+def _state_key(namespace: str) -> str:
+    return f"{namespace}/state.json"
+
+
+def _etag_path(cache_path: Path) -> Path:
+    return cache_path.with_name(cache_path.name + ".etag")
+
+
+def _body_digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _write_cache(cache_path: Path, body: bytes, etag: str | None) -> None:
+    """Write the cached body, and its ETag if S3 reported one."""
+    file.write(cache_path, body)
+    if etag:
+        file.write(_etag_path(cache_path), f"{etag}\n{_body_digest(body)}")
+    else:
+        file.delete(_etag_path(cache_path))
+
+
+def _read_etag(cache_path: Path, cached: str) -> str | None:
+    """ETag of the cached body, or None if it was recorded for another body."""
+    match (file.read(_etag_path(cache_path)) or "").split("\n"):
+        case [etag, digest] if etag and digest == _body_digest(cached.encode("utf-8")):
+            return etag
+        case _:
+            return None
+
+
+def _guess_state_location(namespace: str, cache_path: Path) -> str | None:
+    """Likely S3 URI of the state: last seen in-process, else from the stale cache.
+
+    Only a hint for prefetching; load() uses it only if SSM agrees.
+    """
+    match _known_locations.get(namespace):
+        case (_, s3_uri):
+            return s3_uri
+        case _:
+            pass
+    try:
+        cached = file.read(cache_path)
+        if not cached:
+            return None
+        bucket = Arn(json.loads(cached)["init"]["bucket_arn"]).resource_id
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return f"s3://{bucket}/{_state_key(namespace)}"
+
+
+def _fetch_state(
+    s3: S3Client, namespace: str, s3_uri: str, etag: str | None = None
+) -> Result[tuple[bytes, str | None] | None, StateLoadError]:
+    """Read the raw state object at s3_uri, with its ETag.
+
+    If etag is given and still matches, returns Ok(None): not modified.
+    """
+    bucket, key = _parse_s3_uri(s3_uri)
+    try:
+        if etag:
+            response = s3.get_object(Bucket=bucket, Key=key, IfNoneMatch=etag)
+        else:
+            response = s3.get_object(Bucket=bucket, Key=key)
+        return Ok((response["Body"].read(), response.get("ETag")))
+    except ClientError as e:
+        code = e.response["Error"]["Code"]
+        if code == "304":
+            return ok(None)
+        if code == "NoSuchKey":
+            return Err(StateLoadError(namespace, f"State file not found at {s3_uri}"))
+        return Err(StateLoadError(namespace, str(e)))
+
+
 def _get_state_location(ssm: SSMClient, namespace: str) -> Result[str, SSMReadError]:
     """Get S3 URI from SSM parameter."""
     param_name = SSM_STATE_LOCATION.format(namespace=namespace)
@@ -61,7 +172,7 @@ def _set_state_location(ssm: SSMClient, namespace: str, s3_uri: str) -> Result[N
     param_name = SSM_STATE_LOCATION.format(namespace=namespace)
     try:
         ssm.put_parameter(Name=param_name, Value=s3_uri, Type="String", Overwrite=True)
-        return Ok(None)
+        return ok(None)
     except ClientError as e:
         return Err(SSMWriteError(param_name, str(e)))
 
@@ -71,49 +182,122 @@ def load(
     s3: S3Client,
     namespace: str,
     skip_cache: bool = False,
+    cache_uninitialized: bool = False,
 ) -> Result[State | None, StateLoadError]:
     """Load state, using cache if fresh.
 
+    With cache_uninitialized, a "not initialized" answer is remembered and
+    reused for UNINITIALIZED_TTL seconds (for status polling).
+
     Returns Ok(None) if namespace is not initialized.
     Returns Ok(State) if state was loaded successfully.
     Returns Err if there was an error loading state.
     """
     cache_path = paths.state_cache_path(namespace)
 
-    # Check cache first (unless skipped)
-    if not skip_cache and file.is_fresh(cache_path, CACHE_TTL):
+    if not skip_cache:
+        # In-process memo first; parse a fresh State since callers mutate it
+        match _memo.get(namespace):
+            case (memo_ssm, memo_s3, data, seen_at) if (
+                memo_ssm is ssm and memo_s3 is s3 and time.monotonic() - seen_at < CACHE_TTL
+            ):
+                return Ok(State.from_json(data))
+            case _:
+                pass
+
+        # Recently confirmed uninitialized: skip the SSM round-trip
+        match _uninitialized.get(namespace):
+            case (seen_ssm, seen_at) if (
+                cache_uninitialized
+                and seen_ssm is ssm
+                and time.monotonic() - seen_at < UNINITIALIZED_TTL
+            ):
+                return ok(None)
+            case _:
+                pass
+
+        # Then the on-disk cache
+        if file.is_fresh(cache_path, CACHE_TTL):
+            cached = file.read(cache_path)
+            if cached:
+                # Dated by the file, so the memo never outlives the cache
+                seen_at = time.monotonic() - file.age(cache_path)
+                _memo[namespace] = (ssm, s3, cached, seen_at)
+                return Ok(State.from_json(cached))
+
+    # A stale cache can still be revalidated against S3 by its ETag
+    cached, etag = None, None
+    if not skip_cache:
         cached = file.read(cache_path)
-        if cached:
+        etag = _read_etag(cache_path, cached) if cached else None
+
+    # If the location is probably known, fetch from S3 while SSM confirms it,
+    # overlapping the two round-trips
+    guess = _guess_state_location(namespace, cache_path)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        prefetch = pool.submit(_fetch_state, s3, namespace, guess, etag) if guess else None
+
+        # Get S3 location from SSM
+        match _get_state_location(ssm, namespace):
+            case Err(SSMReadError(_, reason)) if "not found" in reason.lower():
+                # Not initialized - this is OK, just return None
+                if cache_uninitialized:
+                    _uninitialized[namespace] = (ssm, time.monotonic())
+                return ok(None)
+            case Err(e):
+                return Err(StateLoadError(namespace, e.reason))
+            case Ok(s3_uri):
+                _known_locations[namespace] = (ssm, s3_uri)
+
+        # Fetch from S3, unless the prefetch already read the right object
+        if prefetch is not None and guess == s3_uri:
+            fetched = prefetch.result()
+        else:
+            fetched = _fetch_state(s3, namespace, s3_uri, etag)
+
+    match fetched:
+        case Err() as e:
+            return e
+        case Ok(None) if cached:
+            # Not modified: the cached body is current again
+            file.touch(cache_path)
+            _memo[namespace] = (ssm, s3, cached, time.monotonic())
             return Ok(State.from_json(cached))
-
-    # Get S3 location from SSM
-    match _get_state_location(ssm, namespace):
-        case Err(SSMReadError(_, reason)) if "not found" in reason.lower():
-            # Not initialized - this is OK, just return None
-            return Ok(None)
-        case Err(e):
-            return Err(StateLoadError(namespace, e.reason))
-        case Ok(s3_uri):
+        case Ok((body, new_etag)):
             pass
 
-    # Fetch from S3
-    bucket, key = _parse_s3_uri(s3_uri)
-    try:
-        response = s3.get_object(Bucket=bucket, Key=key)
-        data = response["Body"].read().decode("utf-8")
-    except ClientError as e:
-        if e.response["Error"]["Code"] == "NoSuchKey":
-            return Err(StateLoadError(namespace, f"State file not found at {s3_uri}"))
-        return Err(StateLoadError(namespace, str(e)))
-
+    data = body.decode("utf-8")
     state = State.from_json(data)
 
-    # Update cache
-    file.write(cache_path, data)
+    # Update cache (the raw body, already UTF-8)
+    _write_cache(cache_path, body, new_etag)
+    _memo[namespace] = (ssm, s3, data, time.monotonic())
 
     return Ok(state)
 
 
+def load_initialized(
+    ssm: SSMClient,
+    s3: S3Client,
+    namespace: str,
+    skip_cache: bool = False,
+) -> Result[State, NotInitializedError | StateLoadError]:
+    """Load state for a namespace that must already be initialized.
+
+    Returns Err(NotInitializedError) where load() would return Ok(None),
+    or where the loaded state has no init resources.
+    """
+    match load(ssm, s3, namespace, skip_cache=skip_cache):
+        case Err() as e:
+            return e
+        case Ok(None):
+            return Err(NotInitializedError(namespace))
+        case Ok(state) if not state.is_initialized:
+            return Err(NotInitializedError(namespace))
+        case Ok(state):
+            return Ok(state)
+
+
 def save(
     ssm: SSMClient,
     s3: S3Client,
@@ -129,31 +313,59 @@ def save(
         )
 
     bucket = state.init.bucket_arn.resource_id
-    key = f"{state.namespace}/state.json"
-    data = state.to_json()
+    key = _state_key(state.namespace)
+    # Persisted state.json stays indented so it can be read/diffed by hand
+    data = state.to_json(pretty=True)
+    s3_uri = f"s3://{bucket}/{key}"
+
+    # Unchanged since this process last read or wrote it at the known location
+    match (_memo.get(state.namespace), _known_locations.get(state.namespace)):
+        case ((memo_ssm, memo_s3, memo_data, seen_at), (known_ssm, known_uri)) if (
+            memo_ssm is ssm
+            and memo_s3 is s3
+            and time.monotonic() - seen_at < CACHE_TTL
+            and known_ssm is ssm
+            and known_uri == s3_uri
+            and memo_data == data
+        ):
+            return ok(None)
+        case _:
+            pass
+
+    # Encoded once; the same bytes go to S3 and the cache file
+    body = data.encode("utf-8")
 
     # Write to S3
     try:
-        s3.put_object(Bucket=bucket, Key=key, Body=data.encode("utf-8"))
+        response = s3.put_object(Bucket=bucket, Key=key, Body=body, ContentType="application/json")
     except ClientError as e:
         return Err(StateSaveError(state.namespace, f"Failed to write to S3: {e}"))
 
-    # Ensure SSM pointer exists
-    s3_uri = f"s3://{bucket}/{key}"
-    match _set_state_location(ssm, state.namespace, s3_uri):
-        case Err(e):
-            return Err(StateSaveError(state.namespace, f"Failed to update SSM: {e.reason}"))
-        case Ok(_):
+    # Ensure SSM pointer exists (written after the object, so it never dangles)
+    match _known_locations.get(state.namespace):
+        case (known_ssm, known_uri) if known_ssm is ssm and known_uri == s3_uri:
             pass
+        case _:
+            match _set_state_location(ssm, state.namespace, s3_uri):
+                case Err(e):
+                    return Err(StateSaveError(state.namespace, f"Failed to update SSM: {e.reason}"))
+                case Ok(_):
+                    _known_locations[state.namespace] = (ssm, s3_uri)
 
     # Update cache
     cache_path = paths.state_cache_path(state.namespace)
-    file.write(cache_path, data)
+    _write_cache(cache_path, body, response.get("ETag"))
+    _memo[state.namespace] = (ssm, s3, data, time.monotonic())
+    _uninitialized.pop(state.namespace, None)
 
-    return Ok(None)
+    return ok(None)
 
 
 def invalidate_cache(namespace: str) -> None:
     """Delete cached state for a namespace."""
+    _memo.pop(namespace, None)
+    _known_locations.pop(namespace, None)
+    _uninitialized.pop(namespace, None)
     cache_path = paths.state_cache_path(namespace)
     file.delete(cache_path)
+    file.delete(_etag_path(cache_path))
@@ -1,5 +1,7 @@
 """Local file storage for state cache."""
 
+import os
+import tempfile
 import time
 from pathlib import Path
 
@@ -8,21 +10,45 @@ def read(path: Path) -> str | None:
     """Read file contents, or None if doesn't exist."""
     if not path.exists():
         return None
-    return path.read_text()
+    return path.read_text(encoding="utf-8")
 
 
-def write(path: Path, data: str) -> None:
-    """Write data to file, creating parent dirs if needed."""
+def write(path: Path, data: str | bytes) -> None:
+    """Write data to file atomically, creating parent dirs if needed.
+
+    The data goes to a temp file in the same directory, which then replaces
+    path, so concurrent readers see either the old or the new contents.
+    bytes are written as-is, so callers holding already-encoded UTF-8
+    (e.g. an S3 body) avoid a decode/encode round trip.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(data)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def age(path: Path) -> float:
+    """Seconds since the file was last modified."""
+    return time.time() - path.stat().st_mtime
 
 
 def is_fresh(path: Path, ttl_seconds: int) -> bool:
     """Check if file exists and was modified within TTL."""
     if not path.exists():
         return False
-    age = time.time() - path.stat().st_mtime
-    return age < ttl_seconds
+    return age(path) < ttl_seconds
+
+
+def touch(path: Path) -> None:
+    """Mark an existing file as freshly modified."""
+    path.touch()
 
 
 def delete(path: Path) -> None:
@@ -11,11 +11,19 @@ from typing import TYPE_CHECKING
 from botocore.exceptions import ClientError
 
 from iam_ra_cli.lib.errors import S3ReadError, S3WriteError
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from mypy_boto3_s3 import S3Client
 
+# Content type for certificates and private keys
+PEM_CONTENT_TYPE = "application/x-pem-file"
+
+# DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
 
 def read_object(s3: S3Client, bucket: str, key: str) -> Result[str, S3ReadError]:
     """Read object from S3 as string."""
@@ -28,24 +36,65 @@ def read_object(s3: S3Client, bucket: str, key: str) -> Result[str, S3ReadError]
         return Err(S3ReadError(bucket, key, str(e)))
 
 
-def write_object(s3: S3Client, bucket: str, key: str, data: str) -> Result[None, S3WriteError]:
-    """Write string data to S3."""
+def write_object(
+    s3: S3Client,
+    bucket: str,
+    key: str,
+    data: str | bytes,
+    *,
+    content_type: str | None = None,
+) -> Result[None, S3WriteError]:
+    """Write data to S3, optionally tagging its content type.
+
+    str is encoded as UTF-8; bytes are uploaded as-is.
+    """
+    extra = {"ContentType": content_type} if content_type else {}
+    body = data.encode("utf-8") if isinstance(data, str) else data
     try:
-        s3.put_object(Bucket=bucket, Key=key, Body=data.encode("utf-8"))
-        return Ok(None)
+        s3.put_object(Bucket=bucket, Key=key, Body=body, **extra)
+        return ok(None)
     except ClientError as e:
         return Err(S3WriteError(bucket, key, str(e)))
 
 
+def copy_object(
+    s3: S3Client, bucket: str, src_key: str, dst_key: str
+) -> Result[None, S3WriteError]:
+    """Copy object within a bucket server-side (no download/upload)."""
+    try:
+        s3.copy_object(Bucket=bucket, CopySource={"Bucket": bucket, "Key": src_key}, Key=dst_key)
+        return ok(None)
+    except ClientError as e:
+        return Err(S3WriteError(bucket, dst_key, str(e)))
+
+
 def delete_object(s3: S3Client, bucket: str, key: str) -> Result[None, S3WriteError]:
     """Delete object from S3."""
     try:
         s3.delete_object(Bucket=bucket, Key=key)
-        return Ok(None)
+        return ok(None)
     except ClientError as e:
         return Err(S3WriteError(bucket, key, str(e)))
 
 
+def delete_objects(s3: S3Client, bucket: str, keys: Sequence[str]) -> Result[None, S3WriteError]:
+    """Delete many objects from S3 with as few DeleteObjects calls as possible."""
+    for start in range(0, len(keys), DELETE_BATCH_SIZE):
+        batch = keys[start : start + DELETE_BATCH_SIZE]
+        try:
+            response = s3.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+            )
+        except ClientError as e:
+            return Err(S3WriteError(bucket, batch[0], str(e)))
+        # Quiet mode only reports failures
+        if errors := response.get("Errors"):
+            first = errors[0]
+            return Err(S3WriteError(bucket, first["Key"], first.get("Message", first["Code"])))
+    return ok(None)
+
+
 def object_exists(s3: S3Client, bucket: str, key: str) -> bool:
     """Check if object exists in S3."""
     try:
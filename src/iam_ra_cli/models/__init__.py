@@ -6,57 +6,94 @@ Pure data structures with JSON serialization. No storage coupling.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+import types
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum, StrEnum
-from typing import Any, Self
+from functools import cache, cached_property, lru_cache
+from typing import Any, Self, get_args, get_origin, get_type_hints
+
+ARN_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=ARN_CACHE_SIZE)
+def _split_arn(value: str) -> tuple[str, ...]:
+    """Split an ARN into (arn, partition, service, region, account, resource).
+
+    Splits at most 5 times, so colons inside the resource stay in the last
+    part. Memoized by string: the same handful of ARNs is parsed over and
+    over (every State.from_json re-reads every ARN).
+    """
+    return tuple(value.split(":", 5))
+
+
+@lru_cache(maxsize=ARN_CACHE_SIZE)
+def _split_resource(resource: str) -> tuple[str, str]:
+    """(resource_type, resource_id), split on the first '/' if any, else ':'."""
+    if "/" in resource:
+        rtype, _, rid = resource.partition("/")
+    elif ":" in resource:
+        rtype, _, rid = resource.partition(":")
+    else:
+        return resource, resource
+    return rtype, rid
 
 
 class Arn(str):
     """AWS ARN - a string subclass with parsed component access."""
 
     def __new__(cls, value: str) -> Self:
-        parts = value.split(":")
+        parts = _split_arn(value)
         if len(parts) < 6 or parts[0] != "arn":
             raise ValueError(f"Invalid ARN: {value}")
         return super().__new__(cls, value)
 
     @property
     def arn_partition(self) -> str:
-        return self.split(":")[1]
+        return _split_arn(self)[1]
 
     @property
     def service(self) -> str:
-        return self.split(":")[2]
+        return _split_arn(self)[2]
 
     @property
     def region(self) -> str:
-        return self.split(":")[3]
+        return _split_arn(self)[3]
 
     @property
     def account(self) -> str:
-        return self.split(":")[4]
+        return _split_arn(self)[4]
 
     @property
     def resource(self) -> str:
-        return ":".join(self.split(":")[5:])
+        return _split_arn(self)[5]
 
     @property
     def resource_type(self) -> str:
-        res = self.resource
-        if "/" in res:
-            return res.split("/")[0]
-        if ":" in res:
-            return res.split(":")[0]
-        return res
+        return _split_resource(self.resource)[0]
 
     @property
     def resource_id(self) -> str:
-        res = self.resource
-        if "/" in res:
-            return "/".join(res.split("/")[1:])
-        if ":" in res:
-            return ":".join(res.split(":")[1:])
-        return res
+        return _split_resource(self.resource)[1]
+
+
+ARN_INTERN_SIZE = 4096
+
+_arn_intern: dict[str, Arn] = {}
+
+
+def intern_arn(value: str) -> Arn:
+    """Return a shared Arn for value, constructing it on first sight.
+
+    State.from_json rebuilds the same ARNs many times over (e.g. managed
+    policy ARNs attached to every role), so they are deduplicated here. The
+    table is bounded; once full, the oldest entry is evicted.
+    """
+    arn = _arn_intern.get(value)
+    if arn is None:
+        if len(_arn_intern) >= ARN_INTERN_SIZE:
+            del _arn_intern[next(iter(_arn_intern))]
+        arn = _arn_intern[value] = Arn(value)
+    return arn
 
 
 class CAMode(StrEnum):
@@ -67,7 +104,7 @@ class CAMode(StrEnum):
     PCA_EXISTING = "pca-existing"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Init:
     """Bootstrap resources."""
 
@@ -76,7 +113,7 @@ class Init:
     kms_key_arn: Arn
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CA:
     """Certificate Authority configuration."""
 
@@ -86,6 +123,11 @@ class CA:
     pca_arn: Arn | None = None
 
 
+# Role stacks at this version take a TrustAnchorArn parameter (v2 template)
+ROLE_SCHEMA_VERSION = 2
+
+
+# No slots: the cached_property below needs an instance __dict__
 @dataclass(frozen=True)
 class Role:
     """IAM Role with Roles Anywhere profile.
@@ -93,6 +135,9 @@ class Role:
     The scope field determines which CA/Trust Anchor this role
     is associated with. Certs signed by a scope's CA can only
     assume roles within that same scope.
+
+    schema_version records which role template the stack was last
+    deployed with; v1 state has no such field and loads as 1.
     """
 
     stack_name: str
@@ -100,9 +145,20 @@ class Role:
     profile_arn: Arn
     policies: tuple[Arn, ...] = ()
     scope: str = "default"
+    schema_version: int = 1
 
+    def __post_init__(self) -> None:
+        for policy in self.policies:
+            if type(policy) is not Arn:
+                raise TypeError(f"Role policies must be Arn, got {type(policy).__name__}")
 
-@dataclass(frozen=True)
+    @cached_property
+    def policies_str(self) -> tuple[str, ...]:
+        """Policy ARNs as plain strings, e.g. for CFN parameters."""
+        return tuple(str(p) for p in self.policies)
+
+
+@dataclass(frozen=True, slots=True)
 class Host:
     """Onboarded host with certificate."""
 
@@ -113,7 +169,7 @@ class Host:
     private_key_secret_arn: Arn
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class K8sCluster:
     """Kubernetes cluster configured for IAM Roles Anywhere.
 
@@ -124,7 +180,7 @@ class K8sCluster:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class K8sWorkload:
     """Kubernetes workload onboarded to IAM Roles Anywhere.
 
@@ -138,7 +194,13 @@ class K8sWorkload:
     namespace: str = "default"
 
 
-@dataclass
+# json.dumps builds a fresh encoder whenever it is given options (indent);
+# these are built once. Output matches json.dumps(obj[, indent=2]).
+_COMPACT_ENCODER = json.JSONEncoder()
+_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+
+
+@dataclass(slots=True)
 class State:
     """Complete IAM Roles Anywhere state for a namespace.
 
@@ -165,8 +227,14 @@ class State:
         """Backward-compat: return the default scope CA, or None."""
         return self.cas.get("default")
 
-    def to_json(self) -> str:
-        return json.dumps(asdict(self), indent=2)
+    def hosts_using_role(self, role_name: str) -> tuple[str, ...]:
+        """Hostnames of hosts onboarded with the given role."""
+        return tuple(h for h, host in self.hosts.items() if host.role_name == role_name)
+
+    def to_json(self, *, pretty: bool = False) -> str:
+        """Serialize to JSON; compact unless pretty (2-space indented) is requested."""
+        encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+        return encoder.encode(_to_dict(self))
 
     @classmethod
     def from_json(cls, data: str) -> Self:
@@ -181,12 +249,39 @@ class State:
         return _from_dict(cls, raw)
 
 
+@cache
+def _field_types(cls: type) -> tuple[tuple[str, Any], ...]:
+    """(name, resolved type) for each field of a dataclass, resolved once per class.
+
+    get_type_hints re-evaluates every (string) annotation on each call, which
+    made it the bulk of from_json's cost when called per nested instance.
+    """
+    hints = get_type_hints(cls)
+    return tuple((f.name, hints[f.name]) for f in fields(cls))
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _to_dict(obj: Any) -> Any:
+    """Plain JSON-ready form of a model, the inverse of _from_dict.
+
+    Same output as dataclasses.asdict, without its per-value deepcopy.
+    Arn and StrEnum values are str and pass through as-is.
+    """
+    if isinstance(obj, dict):
+        return {k: _to_dict(v) for k, v in obj.items()}
+    if isinstance(obj, (tuple, list)):
+        return [_to_dict(v) for v in obj]
+    if is_dataclass(obj):
+        return {name: _to_dict(getattr(obj, name)) for name in _field_names(type(obj))}
+    return obj
+
+
 def _from_dict(cls: type, data: Any) -> Any:
     """Reconstruct typed dataclass from dict. Handles Arn, Enum, Optional, nested."""
-    import types
-    from dataclasses import fields, is_dataclass
-    from typing import get_args, get_origin, get_type_hints
-
     if data is None:
         return None
 
@@ -199,7 +294,7 @@ def _from_dict(cls: type, data: Any) -> Any:
 
     # Arn (str subclass)
     if cls is Arn or (isinstance(cls, type) and issubclass(cls, Arn)):
-        return Arn(data)
+        return intern_arn(data)
 
     # Enum
     if isinstance(cls, type) and issubclass(cls, Enum):
@@ -207,11 +302,10 @@ def _from_dict(cls: type, data: Any) -> Any:
 
     # Dataclass
     if is_dataclass(cls):
-        hints = get_type_hints(cls)
         kwargs = {}
-        for f in fields(cls):
-            if f.name in data:
-                kwargs[f.name] = _from_dict(hints[f.name], data[f.name])
+        for name, hint in _field_types(cls):
+            if name in data:
+                kwargs[name] = _from_dict(hint, data[name])
         return cls(**kwargs)
 
     # dict[K, V]
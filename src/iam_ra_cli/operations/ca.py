@@ -21,7 +21,7 @@ from iam_ra_cli.lib.errors import (
     StackDeployError,
 )
 from iam_ra_cli.lib.result import Err, Ok, Result
-from iam_ra_cli.lib.storage.s3 import write_object
+from iam_ra_cli.lib.storage.s3 import PEM_CONTENT_TYPE, write_object
 from iam_ra_cli.lib.templates import get_template_path
 from iam_ra_cli.models import Arn
 
@@ -91,7 +91,9 @@ def create_self_signed_ca(
     )
 
     # Upload CA certificate to S3
-    match write_object(ctx.s3, bucket_name, cert_s3_key, ca_keypair.certificate):
+    match write_object(
+        ctx.s3, bucket_name, cert_s3_key, ca_keypair.certificate, content_type=PEM_CONTENT_TYPE
+    ):
         case Err(e):
             return Err(e)
         case Ok(_):
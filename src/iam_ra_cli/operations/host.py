@@ -18,8 +18,13 @@ from iam_ra_cli.lib.errors import (
     PCATimeoutError,
     StackDeleteError,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
-from iam_ra_cli.lib.storage.s3 import delete_object, read_object, write_object
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
+from iam_ra_cli.lib.storage.s3 import (
+    PEM_CONTENT_TYPE,
+    delete_object,
+    read_object,
+    write_object,
+)
 from iam_ra_cli.lib.templates import get_template_path
 from iam_ra_cli.models import Arn
 from iam_ra_cli.operations.ca import _ca_cert_s3_key, _ca_key_local_path
@@ -112,13 +117,17 @@ def onboard_host_self_signed(
     )
 
     # Upload host cert and key to S3
-    match write_object(ctx.s3, bucket_name, cert_s3_key, host_keypair.certificate):
+    match write_object(
+        ctx.s3, bucket_name, cert_s3_key, host_keypair.certificate, content_type=PEM_CONTENT_TYPE
+    ):
         case Err(e):
             return Err(e)
         case Ok(_):
             pass
 
-    match write_object(ctx.s3, bucket_name, key_s3_key, host_keypair.private_key):
+    match write_object(
+        ctx.s3, bucket_name, key_s3_key, host_keypair.private_key, content_type=PEM_CONTENT_TYPE
+    ):
         case Err(e):
             return Err(e)
         case Ok(_):
@@ -239,13 +248,17 @@ def onboard_host_pca(
     host_cert_pem = cert_resp["Certificate"]
 
     # Step 6: Upload host cert and private key to S3
-    match write_object(ctx.s3, bucket_name, cert_s3_key, host_cert_pem):
+    match write_object(
+        ctx.s3, bucket_name, cert_s3_key, host_cert_pem, content_type=PEM_CONTENT_TYPE
+    ):
         case Err(e):
             return Err(e)
         case Ok(_):
             pass
 
-    match write_object(ctx.s3, bucket_name, key_s3_key, host_key_csr.private_key_pem):
+    match write_object(
+        ctx.s3, bucket_name, key_s3_key, host_key_csr.private_key_pem, content_type=PEM_CONTENT_TYPE
+    ):
         case Err(e):
             return Err(e)
         case Ok(_):
@@ -303,4 +316,4 @@ def offboard_host(
     delete_object(ctx.s3, bucket_name, cert_s3_key)
     delete_object(ctx.s3, bucket_name, key_s3_key)
 
-    return Ok(None)
+    return ok(None)
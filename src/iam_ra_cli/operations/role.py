@@ -1,6 +1,7 @@
 """Role operations - IAM Role stack deployment."""
 
 from dataclasses import dataclass
+from functools import cache
 
 from iam_ra_cli.lib.aws import AwsContext
 from iam_ra_cli.lib.cfn import delete_stack, deploy_stack
@@ -16,7 +17,9 @@ def _stack_name(namespace: str, role_name: str) -> str:
     return f"iam-ra-{namespace}-role-{role_name}"
 
 
+@cache
 def _load_template(name: str) -> str:
+    # Bundled templates never change at runtime; role fan-outs read this once
     path = get_template_path(name)
     return path.read_text()
 
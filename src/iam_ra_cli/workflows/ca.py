@@ -15,7 +15,7 @@ from iam_ra_cli.lib.errors import (
     StateLoadError,
     StateSaveError,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 from iam_ra_cli.models import CA, CAMode
 from iam_ra_cli.operations.ca import (
     create_self_signed_ca,
@@ -58,17 +58,12 @@ def setup_ca(
         CA configuration on success
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     assert state.init is not None
 
     # Check scope doesn't already exist
@@ -130,17 +125,12 @@ def delete_scope(
         None on success
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     # Check scope exists
     if scope not in state.cas:
         return Err(CAScopeNotFoundError(namespace, scope))
@@ -149,8 +139,8 @@ def delete_scope(
 
     # Delete the CFN stack
     match delete_ca_op(ctx, ca.stack_name):
-        case Err(e):
-            return Err(e)
+        case Err() as e:
+            return e
         case Ok(_):
             pass
 
@@ -162,7 +152,7 @@ def delete_scope(
         case Ok(_):
             pass
 
-    return Ok(None)
+    return ok(None)
 
 
 def list_cas(
@@ -178,15 +168,10 @@ def list_cas(
     Returns:
         Dict of scope name -> CA on success
     """
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     return Ok(state.cas)
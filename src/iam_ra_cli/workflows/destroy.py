@@ -3,7 +3,7 @@
 from iam_ra_cli.lib import state as state_module
 from iam_ra_cli.lib.aws import AwsContext
 from iam_ra_cli.lib.errors import NotInitializedError, StackDeleteError, StateLoadError
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 from iam_ra_cli.operations.ca import delete_ca
 from iam_ra_cli.operations.host import offboard_host
 from iam_ra_cli.operations.infra import delete_init
@@ -23,51 +23,48 @@ def destroy(ctx: AwsContext, namespace: str) -> Result[None, DestroyError]:
     5. Clear local cache
     """
     # Load current state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.init:
-        return Err(NotInitializedError(namespace))
+    assert state.init is not None
 
     bucket_name = state.init.bucket_arn.resource_id
 
     # Step 1: Delete all host stacks
     for hostname, host in state.hosts.items():
         match offboard_host(ctx, host.stack_name, bucket_name, namespace, hostname):
-            case Err(e):
-                return Err(e)
+            case Err() as e:
+                return e
             case Ok(_):
                 pass
 
     # Step 2: Delete all role stacks
     for role_name, role in state.roles.items():
         match delete_role(ctx, role.stack_name):
-            case Err(e):
-                return Err(e)
+            case Err() as e:
+                return e
             case Ok(_):
                 pass
 
     # Step 3: Delete all CA stacks (all scopes)
     for scope_name, ca in state.cas.items():
         match delete_ca(ctx, ca.stack_name):
-            case Err(e):
-                return Err(e)
+            case Err() as e:
+                return e
             case Ok(_):
                 pass
 
     # Step 4: Delete init stack (this will empty and delete the bucket)
     match delete_init(ctx, namespace):
-        case Err(e):
-            return Err(e)
+        case Err() as e:
+            return e
         case Ok(_):
             pass
 
     # Step 5: Clear local cache
     state_module.invalidate_cache(namespace)
 
-    return Ok(None)
+    return ok(None)
@@ -16,7 +16,7 @@ from iam_ra_cli.lib.errors import (
     StateLoadError,
     StateSaveError,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 from iam_ra_cli.models import Arn, CAMode, Host
 from iam_ra_cli.operations.host import (
     HostError,
@@ -88,17 +88,12 @@ def onboard(ctx: AwsContext, config: OnboardConfig) -> Result[OnboardResult, Onb
     7. Update state
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, config.namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(config.namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, config.namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(config.namespace))
-
     assert state.init is not None
 
     # Validate role exists
@@ -217,17 +212,12 @@ def offboard(
     5. Update state
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     assert state.init is not None
 
     # Check host exists
@@ -252,15 +242,13 @@ def offboard(
         case Ok(_):
             pass
 
-    return Ok(None)
+    return ok(None)
 
 
 def list_hosts(ctx: AwsContext, namespace: str) -> Result[dict[str, Host], ListHostsError]:
     """List all hosts in a namespace."""
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             return Ok(state.hosts)
@@ -24,7 +24,7 @@ from iam_ra_cli.lib.k8s import (
     WorkloadManifests,
     generate_workload_manifests,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
 from iam_ra_cli.lib.storage.s3 import read_object
 from iam_ra_cli.models import CAMode, K8sCluster, K8sWorkload
 from iam_ra_cli.operations.ca import _ca_cert_s3_key, _ca_key_local_path
@@ -116,17 +116,12 @@ def setup(
         SetupResult with cluster info
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     # Create or retrieve cluster record (idempotent)
     already_exists = cluster_name in state.k8s_clusters
     cluster = state.k8s_clusters.get(cluster_name, K8sCluster(name=cluster_name))
@@ -161,17 +156,12 @@ def teardown(
         None on success
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     # Check cluster exists
     if cluster_name not in state.k8s_clusters:
         return Err(K8sClusterNotFoundError(cluster_name))
@@ -191,7 +181,7 @@ def teardown(
         case Ok(_):
             pass
 
-    return Ok(None)
+    return ok(None)
 
 
 def onboard(
@@ -232,17 +222,12 @@ def onboard(
         OnboardResult with workload info and manifests
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     assert state.init is not None
 
     # Check cluster exists
@@ -271,8 +256,8 @@ def onboard(
     ca_cert_key = _ca_cert_s3_key(namespace, scope)
 
     match read_object(ctx.s3, bucket_name, ca_cert_key):
-        case Err(e):
-            return Err(e)
+        case Err() as e:
+            return e
         case Ok(ca_cert_pem):
             pass
 
@@ -339,17 +324,12 @@ def offboard(
         None on success
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     # Check workload exists
     if workload_name not in state.k8s_workloads:
         return Err(K8sWorkloadNotFoundError(workload_name))
@@ -362,7 +342,7 @@ def offboard(
         case Ok(_):
             pass
 
-    return Ok(None)
+    return ok(None)
 
 
 def list_k8s(
@@ -381,17 +361,12 @@ def list_k8s(
         ListResult with clusters and workloads
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     clusters = state.k8s_clusters
     workloads = state.k8s_workloads
 
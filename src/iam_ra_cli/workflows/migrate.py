@@ -2,16 +2,23 @@
 
 Handles all aspects of migration:
 1. State JSON: auto-migrated by State.from_json(), re-saved in v2 format
-2. S3 paths: copy CA cert from old to scoped path, delete old
+2. S3 paths: copy CA cert from old to scoped path, delete old once saved
 3. Local paths: move CA private key from old to scoped path
 4. CA CFN stacks: create new v2 stack per scope, delete old v1 stack
-5. Role CFN stacks: update with new template (adds TrustAnchorArn param)
+5. Role CFN stacks: update with new template (adds TrustAnchorArn param),
+   skipping roles whose recorded schema_version is already current
 6. Bump state version to 2.0.0
 
 Idempotent: safe to run multiple times. Skips already-migrated paths/stacks.
+
+The S3 cert copy and then the local key move run in order on the calling
+thread, so a failed copy leaves the local key untouched. Only the role stack
+updates fan out across a thread pool.
 """
 
-from dataclasses import dataclass, field
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 
 from iam_ra_cli.lib import paths
 from iam_ra_cli.lib import state as state_module
@@ -24,9 +31,9 @@ from iam_ra_cli.lib.errors import (
     StateLoadError,
     StateSaveError,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
-from iam_ra_cli.lib.storage.s3 import delete_object, object_exists, read_object, write_object
-from iam_ra_cli.models import CA, Arn
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
+from iam_ra_cli.lib.storage.s3 import copy_object, delete_objects, object_exists
+from iam_ra_cli.models import CA, ROLE_SCHEMA_VERSION, Arn
 from iam_ra_cli.operations.ca import (
     ROOTCA_SELF_SIGNED_TEMPLATE,
     _ca_cert_s3_key,
@@ -44,6 +51,10 @@ from iam_ra_cli.operations.role import create_role as create_role_op
 
 STATE_VERSION_V2 = "2.0.0"
 
+# Worker threads for the role stack update fan-out.
+# Kept below the clients' connection pool size (aws.MAX_POOL_CONNECTIONS).
+MAX_WORKERS = 8
+
 # =============================================================================
 # Error / Result Types
 # =============================================================================
@@ -78,6 +89,61 @@ def _old_ca_key_local_path(namespace: str):
     return paths.data_dir() / namespace / "ca-private-key.pem"
 
 
+def _migrate_s3_cert(
+    ctx: AwsContext, namespace: str, bucket_name: str
+) -> Result[tuple[bool, bool], StateSaveError]:
+    """Copy the CA cert from the v1 S3 path to the default scope path.
+
+    The old key is left in place; migrate() deletes it with the other
+    obsolete keys once the new state is saved. A scoped cert that already
+    exists is never overwritten, but the old key is still reported, so a
+    run that failed after copying does not orphan it.
+
+    Returns Ok((copied, old_key_exists)).
+    """
+    old_s3_key = _old_ca_cert_s3_key(namespace)
+    new_s3_key = _ca_cert_s3_key(namespace, "default")
+
+    if not object_exists(ctx.s3, bucket_name, old_s3_key):
+        return Ok((False, False))
+    if object_exists(ctx.s3, bucket_name, new_s3_key):
+        return Ok((False, True))
+
+    # Copy to new scoped path (server-side)
+    match copy_object(ctx.s3, bucket_name, old_s3_key, new_s3_key):
+        case Err(e):
+            return Err(StateSaveError(namespace, f"Failed to copy CA cert to scoped path: {e}"))
+        case Ok(_):
+            pass
+
+    return Ok((True, True))
+
+
+def _migrate_local_key(namespace: str) -> bool:
+    """Move the CA private key from the v1 local path to the default scope path.
+
+    Returns True if the key was moved, False if there was nothing to move.
+    """
+    old_key_path = _old_ca_key_local_path(namespace)
+    new_key_path = _ca_key_local_path(namespace, "default")
+
+    if not old_key_path.exists():
+        return False
+
+    new_key_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Same filesystem: a single atomic rename
+        old_key_path.replace(new_key_path)
+    except OSError:
+        # Cross-device: copy the key across, then delete the old one
+        new_key_path.write_text(old_key_path.read_text())
+        old_key_path.unlink()
+
+    if stat.S_IMODE(new_key_path.stat().st_mode) != 0o600:
+        new_key_path.chmod(0o600)
+    return True
+
+
 def update_role_stack(
     ctx: AwsContext,
     namespace: str,
@@ -102,7 +168,7 @@ def update_role_stack(
         case Err() as e:
             return e
         case Ok(_):
-            return Ok(None)
+            return ok(None)
 
 
 def migrate_ca_stack(
@@ -174,129 +240,121 @@ def migrate(ctx: AwsContext, namespace: str) -> Result[MigrateResult, MigrateErr
     4. Migrate CA CFN stacks (create new v2 stack, delete old v1 stack)
     5. Update role CFN stacks with TrustAnchorArn parameter
     6. Bump version to 2.0.0
-    7. Re-save state in v2 format
+    7. Re-save state in v2 format, if steps 4-6 changed anything
+    8. Delete obsolete v1 S3 keys in one batch
 
     Idempotent: safe to run multiple times.
     """
     # 1. Load state (auto-migrates v1 JSON to v2 in-memory)
-    match state_module.load(ctx.ssm, ctx.s3, namespace, skip_cache=True):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace, skip_cache=True):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     assert state.init is not None
 
     bucket_name = state.init.bucket_arn.resource_id
-    s3_migrated = False
-    local_key_migrated = False
     ca_stack_migrated = False
     roles_updated: list[str] = []
-
-    # 2. Migrate S3 CA cert: old path -> scoped path
-    old_s3_key = _old_ca_cert_s3_key(namespace)
-    new_s3_key = _ca_cert_s3_key(namespace, "default")
-
-    if object_exists(ctx.s3, bucket_name, old_s3_key):
-        # Read from old path
-        match read_object(ctx.s3, bucket_name, old_s3_key):
-            case Err(e):
-                return Err(StateSaveError(namespace, f"Failed to read old CA cert: {e}"))
-            case Ok(cert_pem):
-                pass
-
-        # Write to new scoped path
-        match write_object(ctx.s3, bucket_name, new_s3_key, cert_pem):
-            case Err(e):
-                return Err(StateSaveError(namespace, f"Failed to write scoped CA cert: {e}"))
-            case Ok(_):
-                pass
-
-        # Delete old path
-        delete_object(ctx.s3, bucket_name, old_s3_key)
-        s3_migrated = True
-
-    # 3. Migrate local CA key: old path -> scoped path
-    old_key_path = _old_ca_key_local_path(namespace)
-    new_key_path = _ca_key_local_path(namespace, "default")
-
-    if old_key_path.exists():
-        # Read old key
-        key_pem = old_key_path.read_text()
-
-        # Write to new scoped path
-        new_key_path.parent.mkdir(parents=True, exist_ok=True)
-        new_key_path.write_text(key_pem)
-        new_key_path.chmod(0o600)
-
-        # Delete old key
-        old_key_path.unlink()
-        local_key_migrated = True
-
-    # 4. Migrate CA CFN stacks: create new v2 stack, delete old v1 stack
-    for scope, ca in list(state.cas.items()):
-        expected_v2_name = ca_stack_name(namespace, scope)
-        if ca.stack_name == expected_v2_name:
-            continue  # Already migrated
-
-        match migrate_ca_stack(
-            ctx,
-            namespace=namespace,
-            scope=scope,
-            old_stack_name=ca.stack_name,
-            bucket_name=bucket_name,
-            trust_anchor_arn=str(ca.trust_anchor_arn),
-        ):
+    migrated_scopes: set[str] = set()
+    obsolete_s3_keys: list[str] = []
+
+    # Role updates fan out on a context whose CloudFormation client retries
+    # adaptively; its client is built up front, since cached_property is not
+    # thread-safe.
+    fanout_ctx = ctx.fanout_context()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # 2. Migrate S3 CA cert: old path -> scoped path. The v2 CA stack
+        # reads the cert from the scoped S3 path, so this must finish before
+        # step 4, and an error here aborts before the local key is touched.
+        match _migrate_s3_cert(ctx, namespace, bucket_name):
             case Err() as e:
                 return e
-            case Ok(new_trust_anchor_arn):
-                pass
+            case Ok((s3_migrated, old_key_exists)):
+                if old_key_exists:
+                    obsolete_s3_keys.append(_old_ca_cert_s3_key(namespace))
+
+        # 3. Migrate local CA key: old path -> scoped path (a local rename)
+        local_key_migrated = _migrate_local_key(namespace)
+
+        # 4. Migrate CA CFN stacks: create new v2 stack, delete old v1 stack
+        for scope, ca in list(state.cas.items()):
+            expected_v2_name = ca_stack_name(namespace, scope)
+            if ca.stack_name == expected_v2_name:
+                continue  # Already migrated
+
+            match migrate_ca_stack(
+                ctx,
+                namespace=namespace,
+                scope=scope,
+                old_stack_name=ca.stack_name,
+                bucket_name=bucket_name,
+                trust_anchor_arn=str(ca.trust_anchor_arn),
+            ):
+                case Err() as e:
+                    return e
+                case Ok(new_trust_anchor_arn):
+                    pass
+
+            # Update state with new stack name and new trust anchor ARN
+            state.cas[scope] = CA(
+                stack_name=expected_v2_name,
+                mode=ca.mode,
+                trust_anchor_arn=Arn(new_trust_anchor_arn),
+                pca_arn=ca.pca_arn,
+            )
+            migrated_scopes.add(scope)
+            ca_stack_migrated = True
+
+        # 5. Update role CFN stacks with TrustAnchorArn parameter (fan-out)
+        role_futures = {}
+        for role_name, role in state.roles.items():
+            if role.scope not in state.cas:
+                continue  # skip roles whose scope CA doesn't exist yet
+            if role.schema_version >= ROLE_SCHEMA_VERSION and role.scope not in migrated_scopes:
+                continue  # already on the v2 template and its trust anchor is unchanged
+
+            scope_ca = state.cas[role.scope]
+            role_futures[role_name] = executor.submit(
+                update_role_stack,
+                fanout_ctx,
+                namespace=namespace,
+                name=role_name,
+                trust_anchor_arn=str(scope_ca.trust_anchor_arn),
+                policies=list(role.policies_str),
+                scope=role.scope,
+            )
+
+        # Report in state order; the first failure wins and cancels any
+        # updates still queued behind it
+        for role_name, future in role_futures.items():
+            match future.result():
+                case Err() as e:
+                    executor.shutdown(cancel_futures=True)
+                    return e
+                case Ok(_):
+                    state.roles[role_name] = replace(
+                        state.roles[role_name], schema_version=ROLE_SCHEMA_VERSION
+                    )
+                    roles_updated.append(role_name)
 
-        # Update state with new stack name and new trust anchor ARN
-        state.cas[scope] = CA(
-            stack_name=expected_v2_name,
-            mode=ca.mode,
-            trust_anchor_arn=Arn(new_trust_anchor_arn),
-            pca_arn=ca.pca_arn,
-        )
-        ca_stack_migrated = True
-
-    # 5. Update role CFN stacks with TrustAnchorArn parameter
-    for role_name, role in state.roles.items():
-        scope = role.scope
-        if scope not in state.cas:
-            continue  # skip roles whose scope CA doesn't exist yet
-
-        scope_ca = state.cas[scope]
-        trust_anchor_arn = str(scope_ca.trust_anchor_arn)
-        policies = [str(p) for p in role.policies]
-        match update_role_stack(
-            ctx,
-            namespace=namespace,
-            name=role_name,
-            trust_anchor_arn=trust_anchor_arn,
-            policies=policies,
-            scope=role.scope,
-        ):
+    # 6. Bump version
+    dirty = state.version != STATE_VERSION_V2 or ca_stack_migrated or bool(roles_updated)
+    state.version = STATE_VERSION_V2
+
+    # 7. Re-save state in v2 format (skipped when nothing in it changed)
+    if dirty:
+        match state_module.save(ctx.ssm, ctx.s3, state):
             case Err() as e:
                 return e
             case Ok(_):
-                roles_updated.append(role_name)
-
-    # 6. Bump version
-    state.version = STATE_VERSION_V2
+                pass
 
-    # 7. Re-save state in v2 format
-    match state_module.save(ctx.ssm, ctx.s3, state):
-        case Err() as e:
-            return e
-        case Ok(_):
-            pass
+    # 8. Best-effort cleanup: a leftover v1 key is harmless, as nothing
+    # reads the old path once the scoped cert exists.
+    delete_objects(ctx.s3, bucket_name, obsolete_s3_keys)
 
     return Ok(
         MigrateResult(
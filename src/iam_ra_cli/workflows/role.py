@@ -12,8 +12,8 @@ from iam_ra_cli.lib.errors import (
     StateLoadError,
     StateSaveError,
 )
-from iam_ra_cli.lib.result import Err, Ok, Result
-from iam_ra_cli.models import Role
+from iam_ra_cli.lib.result import Err, Ok, Result, ok
+from iam_ra_cli.models import ROLE_SCHEMA_VERSION, Role
 from iam_ra_cli.operations.role import create_role as create_role_op
 from iam_ra_cli.operations.role import delete_role as delete_role_op
 
@@ -52,17 +52,12 @@ def create_role(
     4. Update state with scope
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     # Validate scope exists
     if scope not in state.cas:
         return Err(CAScopeNotFoundError(namespace, scope))
@@ -91,6 +86,7 @@ def create_role(
         profile_arn=role_result.profile_arn,
         policies=role_result.policies,
         scope=scope,
+        schema_version=ROLE_SCHEMA_VERSION,
     )
 
     # Update state (always -- policies may have changed)
@@ -119,24 +115,19 @@ def delete_role(
     5. Update state
     """
     # Load state
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             pass
 
-    if not state.is_initialized:
-        return Err(NotInitializedError(namespace))
-
     # Check role exists
     if name not in state.roles:
         return Err(RoleNotFoundError(namespace, name))
 
     # Check no hosts are using this role
     if not force:
-        hosts_using = tuple(h for h, host in state.hosts.items() if host.role_name == name)
+        hosts_using = state.hosts_using_role(name)
         if hosts_using:
             return Err(RoleInUseError(name, hosts_using))
 
@@ -157,15 +148,13 @@ def delete_role(
         case Ok(_):
             pass
 
-    return Ok(None)
+    return ok(None)
 
 
 def list_roles(ctx: AwsContext, namespace: str) -> Result[dict[str, Role], ListRolesError]:
     """List all roles in a namespace."""
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
-        case Err(e):
-            return Err(e)
-        case Ok(None):
-            return Err(NotInitializedError(namespace))
+    match state_module.load_initialized(ctx.ssm, ctx.s3, namespace):
+        case Err() as e:
+            return e
         case Ok(state):
             return Ok(state.roles)
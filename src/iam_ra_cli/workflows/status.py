@@ -29,31 +29,28 @@ class Status:
         return self.cas.get("default")
 
 
+def _empty_status(namespace: str, region: str) -> Status:
+    """Uninitialized status, with empty cas/roles/hosts."""
+    return Status(
+        namespace=namespace,
+        region=region,
+        initialized=False,
+        init=None,
+        cas={},
+        roles={},
+        hosts={},
+    )
+
+
 def get_status(ctx: AwsContext, namespace: str) -> Status:
     """Get current status. Never fails - returns uninitialized status if not set up."""
-    match state_module.load(ctx.ssm, ctx.s3, namespace):
+    match state_module.load(ctx.ssm, ctx.s3, namespace, cache_uninitialized=True):
         case Err(_):
             # Error loading state - return uninitialized
-            return Status(
-                namespace=namespace,
-                region=ctx.region,
-                initialized=False,
-                init=None,
-                cas={},
-                roles={},
-                hosts={},
-            )
+            return _empty_status(namespace, ctx.region)
         case Ok(None):
             # Not initialized
-            return Status(
-                namespace=namespace,
-                region=ctx.region,
-                initialized=False,
-                init=None,
-                cas={},
-                roles={},
-                hosts={},
-            )
+            return _empty_status(namespace, ctx.region)
         case Ok(state) if state is not None:
             return Status(
                 namespace=state.namespace,
@@ -66,12 +63,4 @@ def get_status(ctx: AwsContext, namespace: str) -> Status:
             )
 
     # Fallback (should never reach here)
-    return Status(
-        namespace=namespace,
-        region=ctx.region,
-        initialized=False,
-        init=None,
-        cas={},
-        roles={},
-        hosts={},
-    )
+    return _empty_status(namespace, ctx.region)
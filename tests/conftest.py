@@ -41,6 +41,27 @@ def temp_xdg_dirs(monkeypatch: pytest.MonkeyPatch):
         }
 
 
+@pytest.fixture(scope="module")
+def moto_module():
+    """One moto mock for a whole test module.
+
+    Starting and stopping mock_aws() costs far more than resetting its
+    backends, so modules that only need a clean slate per test share one
+    mock and reset it via moto_backends.
+    """
+    mock = mock_aws()
+    mock.start()
+    yield mock
+    mock.stop()
+
+
+@pytest.fixture
+def moto_backends(moto_module):
+    """Fresh (empty) moto backends for each test, on the module's shared mock."""
+    moto_module.reset()
+    return moto_module
+
+
 @pytest.fixture
 def mock_aws_context(aws_credentials, temp_xdg_dirs):
     """Create a complete mocked AWS context."""
@@ -60,9 +81,14 @@ def mock_aws_context(aws_credentials, temp_xdg_dirs):
         yield ctx, temp_xdg_dirs
 
 
-@pytest.fixture
-def sample_ca_keypair():
-    """Generate a sample CA keypair for testing."""
+@pytest.fixture(scope="session")
+def shared_ca():
+    """A real CA keypair, generated once per test session.
+
+    Key generation and signing are the slowest thing the tests do, and no
+    test mutates a KeyPair, so every module that just needs *a* CA reads
+    this one.
+    """
     from iam_ra_cli.lib.crypto import generate_ca
 
-    return generate_ca(common_name="Test CA", validity_years=1)
+    return generate_ca(common_name="Test CA")
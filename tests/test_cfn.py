@@ -5,7 +5,6 @@ and use simple templates that moto can handle.
 """
 
 import pytest
-from moto import mock_aws
 
 from iam_ra_cli.lib.cfn import (
     delete_stack,
@@ -28,13 +27,11 @@ def aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.fixture
-def cfn_client(aws_credentials: None):
+def cfn_client(aws_credentials: None, moto_backends):
     """Create mocked CloudFormation client."""
     import boto3
 
-    with mock_aws():
-        client = boto3.client("cloudformation", region_name="ap-southeast-2")
-        yield client
+    return boto3.client("cloudformation", region_name="ap-southeast-2")
 
 
 # Simple template that moto can handle
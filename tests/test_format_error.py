@@ -1,6 +1,6 @@
 """Tests for commands/common.py - _format_error pattern matching.
 
-Every error type gets its own test to catch:
+Every error type gets its own case to catch:
 - Type aliases used in match/case (crash at runtime)
 - Wrong positional destructuring (silent wrong values)
 - Missing case arms (falls through to generic str())
@@ -8,6 +8,8 @@ Every error type gets its own test to catch:
 
 from pathlib import Path
 
+import pytest
+
 from iam_ra_cli.commands.common import _format_error
 from iam_ra_cli.lib.errors import (
     CAScopeAlreadyExistsError,
@@ -38,161 +40,169 @@ from iam_ra_cli.lib.errors import (
     StateSaveError,
 )
 
-
-class TestFormatInfraErrors:
-    """Tests for infrastructure error formatting."""
-
-    def test_not_initialized(self) -> None:
-        error = NotInitializedError(namespace="prod")
-        result = _format_error(error)
-        assert "prod" in result
-        assert "not initialized" in result
-        assert "iam-ra init" in result
-
-    def test_stack_deploy_error(self) -> None:
-        error = StackDeployError(
+PCA_ARN = "arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc"
+PCA_CERT_ARN = f"{PCA_ARN}/certificate/xyz"
+
+# (error, substrings the formatted message must contain)
+ERROR_CASES = [
+    # Infrastructure
+    pytest.param(
+        NotInitializedError(namespace="prod"),
+        ["prod", "not initialized", "iam-ra init"],
+        id="not_initialized",
+    ),
+    pytest.param(
+        StackDeployError(
             stack_name="my-stack",
             status="ROLLBACK_COMPLETE",
             reason="Resource limit exceeded",
-        )
-        result = _format_error(error)
-        assert "my-stack" in result
-        assert "ROLLBACK_COMPLETE" in result
-        assert "Resource limit exceeded" in result
-
-    def test_stack_delete_error(self) -> None:
-        error = StackDeleteError(
+        ),
+        ["my-stack", "ROLLBACK_COMPLETE", "Resource limit exceeded"],
+        id="stack_deploy",
+    ),
+    pytest.param(
+        StackDeleteError(
             stack_name="my-stack",
             status="DELETE_FAILED",
             reason="Cannot delete non-empty bucket",
-        )
-        result = _format_error(error)
-        assert "my-stack" in result
-        assert "DELETE_FAILED" in result
-        assert "Cannot delete non-empty bucket" in result
-
-
-class TestFormatRoleErrors:
-    """Tests for role error formatting."""
-
-    def test_role_not_found(self) -> None:
-        error = RoleNotFoundError(namespace="default", role_name="readonly")
-        result = _format_error(error)
-        assert "readonly" in result
-        assert "default" in result
-        assert "not found" in result
-
-    def test_role_already_exists(self) -> None:
-        error = RoleAlreadyExistsError(namespace="default", role_name="admin")
-        result = _format_error(error)
-        assert "admin" in result
-        assert "default" in result
-        assert "already exists" in result
-
-    def test_role_in_use(self) -> None:
-        error = RoleInUseError(role_name="readonly", hosts=("host-a", "host-b"))
-        result = _format_error(error)
-        assert "readonly" in result
-        assert "host-a" in result
-        assert "host-b" in result
-        assert "--force" in result
-
-
-class TestFormatHostErrors:
-    """Tests for host error formatting."""
-
-    def test_host_not_found(self) -> None:
-        error = HostNotFoundError(namespace="default", hostname="lnv-01")
-        result = _format_error(error)
-        assert "lnv-01" in result
-        assert "default" in result
-        assert "not found" in result
-
-    def test_host_already_exists(self) -> None:
-        error = HostAlreadyExistsError(namespace="staging", hostname="lnv-01")
-        result = _format_error(error)
-        assert "lnv-01" in result
-        assert "staging" in result
-        assert "already exists" in result
-        assert "--overwrite" in result
-
-
-class TestFormatK8sErrors:
-    """Tests for K8s error formatting."""
-
-    def test_cluster_not_found(self) -> None:
-        error = K8sClusterNotFoundError(cluster_name="prod-cluster")
-        result = _format_error(error)
-        assert "prod-cluster" in result
-        assert "not found" in result
-
-    def test_cluster_already_exists(self) -> None:
-        error = K8sClusterAlreadyExistsError(cluster_name="dev-cluster")
-        result = _format_error(error)
-        assert "dev-cluster" in result
-        assert "already exists" in result
-
-    def test_cluster_in_use(self) -> None:
-        error = K8sClusterInUseError(
-            cluster_name="prod-cluster",
-            workloads=("api-server", "worker"),
-        )
-        result = _format_error(error)
-        assert "prod-cluster" in result
-        assert "api-server" in result
-        assert "worker" in result
-
-    def test_workload_not_found(self) -> None:
-        error = K8sWorkloadNotFoundError(workload_name="api-server")
-        result = _format_error(error)
-        assert "api-server" in result
-        assert "not found" in result
-
-    def test_workload_already_exists(self) -> None:
-        error = K8sWorkloadAlreadyExistsError(workload_name="api-server")
-        result = _format_error(error)
-        assert "api-server" in result
-        assert "already exists" in result
-
-    def test_unsupported_ca_mode(self) -> None:
-        error = K8sUnsupportedCAModeError(ca_mode="acm-pca")
-        result = _format_error(error)
-        assert "acm-pca" in result
-        assert "not supported" in result
-
-
-class TestFormatCAErrors:
-    """Tests for CA scope error formatting."""
-
-    def test_ca_scope_not_found(self) -> None:
-        error = CAScopeNotFoundError(namespace="default", scope="cert-manager")
-        result = _format_error(error)
-        assert "cert-manager" in result
-        assert "default" in result
-        assert "not found" in result
-
-    def test_ca_scope_already_exists(self) -> None:
-        error = CAScopeAlreadyExistsError(namespace="default", scope="cert-manager")
-        result = _format_error(error)
-        assert "cert-manager" in result
-        assert "default" in result
-        assert "already exists" in result
+        ),
+        ["my-stack", "DELETE_FAILED", "Cannot delete non-empty bucket"],
+        id="stack_delete",
+    ),
+    # Roles
+    pytest.param(
+        RoleNotFoundError(namespace="default", role_name="readonly"),
+        ["readonly", "default", "not found"],
+        id="role_not_found",
+    ),
+    pytest.param(
+        RoleAlreadyExistsError(namespace="default", role_name="admin"),
+        ["admin", "default", "already exists"],
+        id="role_already_exists",
+    ),
+    pytest.param(
+        RoleInUseError(role_name="readonly", hosts=("host-a", "host-b")),
+        ["readonly", "host-a", "host-b", "--force"],
+        id="role_in_use",
+    ),
+    # Hosts
+    pytest.param(
+        HostNotFoundError(namespace="default", hostname="lnv-01"),
+        ["lnv-01", "default", "not found"],
+        id="host_not_found",
+    ),
+    pytest.param(
+        HostAlreadyExistsError(namespace="staging", hostname="lnv-01"),
+        ["lnv-01", "staging", "already exists", "--overwrite"],
+        id="host_already_exists",
+    ),
+    # K8s
+    pytest.param(
+        K8sClusterNotFoundError(cluster_name="prod-cluster"),
+        ["prod-cluster", "not found"],
+        id="cluster_not_found",
+    ),
+    pytest.param(
+        K8sClusterAlreadyExistsError(cluster_name="dev-cluster"),
+        ["dev-cluster", "already exists"],
+        id="cluster_already_exists",
+    ),
+    pytest.param(
+        K8sClusterInUseError(cluster_name="prod-cluster", workloads=("api-server", "worker")),
+        ["prod-cluster", "api-server", "worker"],
+        id="cluster_in_use",
+    ),
+    pytest.param(
+        K8sWorkloadNotFoundError(workload_name="api-server"),
+        ["api-server", "not found"],
+        id="workload_not_found",
+    ),
+    pytest.param(
+        K8sWorkloadAlreadyExistsError(workload_name="api-server"),
+        ["api-server", "already exists"],
+        id="workload_already_exists",
+    ),
+    pytest.param(
+        K8sUnsupportedCAModeError(ca_mode="acm-pca"),
+        ["acm-pca", "not supported"],
+        id="unsupported_ca_mode",
+    ),
+    # CA scopes
+    pytest.param(
+        CAScopeNotFoundError(namespace="default", scope="cert-manager"),
+        ["cert-manager", "default", "not found"],
+        id="ca_scope_not_found",
+    ),
+    pytest.param(
+        CAScopeAlreadyExistsError(namespace="default", scope="cert-manager"),
+        ["cert-manager", "default", "already exists"],
+        id="ca_scope_already_exists",
+    ),
+    # State
+    pytest.param(
+        StateLoadError(namespace="prod", reason="JSON decode failed"),
+        ["prod", "JSON decode failed"],
+        id="state_load",
+    ),
+    pytest.param(
+        StateSaveError(namespace="staging", reason="S3 access denied"),
+        ["staging", "S3 access denied"],
+        id="state_save",
+    ),
+    # Secrets. Regression: SecretsError is a type alias (union), not a class;
+    # each concrete type must have its own case arm.
+    pytest.param(
+        SecretsManagerReadError(
+            secret_arn="arn:aws:secretsmanager:us-east-1:123456789012:secret:my-secret",
+            reason="Access denied",
+        ),
+        ["my-secret", "Access denied"],
+        id="secrets_manager_read",
+    ),
+    pytest.param(
+        SOPSEncryptError(path=Path("/home/user/.secrets/host.yaml"), reason="KMS key not found"),
+        ["host.yaml", "KMS key not found"],
+        id="sops_encrypt",
+    ),
+    pytest.param(
+        SecretsFileExistsError(path=Path("/home/user/.secrets/host.yaml")),
+        ["host.yaml", "already exists"],
+        id="secrets_file_exists",
+    ),
+    # PCA
+    pytest.param(
+        PCADescribeError(pca_arn=PCA_ARN, reason="Access denied"),
+        ["abc", "Access denied"],
+        id="pca_describe",
+    ),
+    pytest.param(
+        PCANotActiveError(pca_arn=PCA_ARN, status="PENDING_CERTIFICATE"),
+        # ACTIVE: should tell user what state is expected
+        ["abc", "PENDING_CERTIFICATE", "ACTIVE"],
+        id="pca_not_active",
+    ),
+    pytest.param(
+        PCAIssueCertError(pca_arn=PCA_ARN, reason="MalformedCSRException"),
+        ["abc", "MalformedCSRException"],
+        id="pca_issue_cert",
+    ),
+    pytest.param(
+        PCAGetCertError(pca_arn=PCA_ARN, certificate_arn=PCA_CERT_ARN, reason="Not found"),
+        ["Not found"],
+        id="pca_get_cert",
+    ),
+]
+
+
+@pytest.mark.parametrize("error, expected_substrings", ERROR_CASES)
+def test_format_error(error: object, expected_substrings: list[str]) -> None:
+    result = _format_error(error)
+    missing = [s for s in expected_substrings if s not in result]
+    assert not missing, f"missing: {missing} in {result!r}"
 
 
 class TestFormatStateErrors:
-    """Tests for state error formatting."""
-
-    def test_state_load_error_includes_namespace_and_reason(self) -> None:
-        error = StateLoadError(namespace="prod", reason="JSON decode failed")
-        result = _format_error(error)
-        assert "prod" in result
-        assert "JSON decode failed" in result
-
-    def test_state_save_error_includes_namespace_and_reason(self) -> None:
-        error = StateSaveError(namespace="staging", reason="S3 access denied")
-        result = _format_error(error)
-        assert "staging" in result
-        assert "S3 access denied" in result
+    """Field-order regressions for state errors."""
 
     def test_state_load_error_does_not_swap_fields(self) -> None:
         """Regression: positional destructuring must match field order."""
@@ -215,86 +225,12 @@ class TestFormatStateErrors:
         assert ns_pos < reason_pos, "namespace should appear before reason in the message"
 
 
-class TestFormatSecretsErrors:
-    """Tests for secrets error formatting.
-
-    Regression: SecretsError is a type alias (union), not a class.
-    Each concrete type must have its own case arm.
-    """
-
-    def test_secrets_manager_read_error(self) -> None:
-        error = SecretsManagerReadError(
-            secret_arn="arn:aws:secretsmanager:us-east-1:123456789012:secret:my-secret",
-            reason="Access denied",
-        )
-        result = _format_error(error)
-        assert "my-secret" in result
-        assert "Access denied" in result
-
-    def test_sops_encrypt_error(self) -> None:
-        error = SOPSEncryptError(
-            path=Path("/home/user/.secrets/host.yaml"),
-            reason="KMS key not found",
-        )
-        result = _format_error(error)
-        assert "host.yaml" in result
-        assert "KMS key not found" in result
-
-    def test_secrets_file_exists_error(self) -> None:
-        error = SecretsFileExistsError(path=Path("/home/user/.secrets/host.yaml"))
-        result = _format_error(error)
-        assert "host.yaml" in result
-        assert "already exists" in result
-
-
-class TestFormatPCAErrors:
-    """Tests for PCA error formatting."""
-
-    def test_pca_describe_error(self) -> None:
-        error = PCADescribeError(
-            pca_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc",
-            reason="Access denied",
-        )
-        result = _format_error(error)
-        assert "abc" in result
-        assert "Access denied" in result
-
-    def test_pca_not_active_error(self) -> None:
-        error = PCANotActiveError(
-            pca_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc",
-            status="PENDING_CERTIFICATE",
-        )
-        result = _format_error(error)
-        assert "abc" in result
-        assert "PENDING_CERTIFICATE" in result
-        assert "ACTIVE" in result  # should tell user what state is expected
-
-    def test_pca_issue_cert_error(self) -> None:
-        error = PCAIssueCertError(
-            pca_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc",
-            reason="MalformedCSRException",
-        )
-        result = _format_error(error)
-        assert "abc" in result
-        assert "MalformedCSRException" in result
-
-    def test_pca_get_cert_error(self) -> None:
-        error = PCAGetCertError(
-            pca_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc",
-            certificate_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc/certificate/xyz",
-            reason="Not found",
-        )
-        result = _format_error(error)
-        assert "Not found" in result
-
-    def test_pca_timeout_error(self) -> None:
-        error = PCATimeoutError(
-            pca_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc",
-            certificate_arn="arn:aws:acm-pca:ap-southeast-2:123:certificate-authority/abc/certificate/xyz",
-        )
-        result = _format_error(error)
-        assert "abc" in result
-        assert "timeout" in result.lower() or "timed out" in result.lower()
+def test_pca_timeout_error() -> None:
+    # Either wording is fine, so this one doesn't fit the substring table
+    error = PCATimeoutError(pca_arn=PCA_ARN, certificate_arn=PCA_CERT_ARN)
+    result = _format_error(error)
+    assert "abc" in result
+    assert "timeout" in result.lower() or "timed out" in result.lower()
 
 
 class TestFormatUnknownError:
@@ -1,13 +1,15 @@
 """Tests for K8s manifest generation and workflows."""
 
 import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
-from moto import mock_aws
+import yaml
 
 from iam_ra_cli.lib import state as state_module
 from iam_ra_cli.lib.aws import AwsContext
+from iam_ra_cli.lib.crypto import KeyPair
 from iam_ra_cli.lib.k8s import (
     DEFAULT_CA_SECRET_NAME,
     DEFAULT_CERT_DURATION_HOURS,
@@ -63,48 +65,37 @@ IPq3pPTbbMOQ2NwlKgrosN9MzKZM5BPOUw==
 -----END EC PRIVATE KEY-----"""
 
 
-@pytest.fixture
-def aws_context(monkeypatch):
-    """Create an AwsContext for testing with isolated XDG data dir."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = Path(tmpdir) / "data"
-        data_dir.mkdir()
-        monkeypatch.setenv("XDG_DATA_HOME", str(data_dir))
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory, shared_ca: KeyPair) -> Path:
+    """XDG data dir with the default scope's CA key, written once per module.
 
-        # Create CA private key in the scoped location
-        ca_key_dir = data_dir / "iam-ra" / "default" / "scopes" / "default"
-        ca_key_dir.mkdir(parents=True)
-        (ca_key_dir / "ca-private-key.pem").write_text(SAMPLE_CA_KEY)
+    The k8s workflows only ever read the key, so tests can share it.
+    """
+    data_dir = tmp_path_factory.mktemp("iamra_data")
 
-        with mock_aws():
-            ctx = AwsContext(region="us-east-1")
-            yield ctx
+    # Create CA private key in the scoped location
+    ca_key_dir = data_dir / "iam-ra" / "default" / "scopes" / "default"
+    ca_key_dir.mkdir(parents=True)
+    (ca_key_dir / "ca-private-key.pem").write_text(shared_ca.private_key)
 
+    return data_dir
 
-@pytest.fixture
-def initialized_state(aws_context: AwsContext) -> State:
-    """Create an initialized state with CA and roles."""
-    # Invalidate any cached state first
-    state_module.invalidate_cache("default")
 
-    # Create S3 bucket
-    aws_context.s3.create_bucket(Bucket="test-bucket")
+@pytest.fixture
+def aws_context(monkeypatch, moto_backends, data_dir: Path) -> AwsContext:
+    """Create an AwsContext for testing with isolated XDG data dir."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(data_dir))
+    return AwsContext(region="us-east-1")
 
-    # Upload CA cert to scoped S3 path
-    aws_context.s3.put_object(
-        Bucket="test-bucket",
-        Key="default/scopes/default/ca/certificate.pem",
-        Body=SAMPLE_CA_CERT.encode(),
-    )
 
-    # Create SSM parameter
-    aws_context.ssm.put_parameter(
-        Name="/iam-ra/default/state-location",
-        Value="s3://test-bucket/default/state.json",
-        Type="String",
-    )
+@pytest.fixture(scope="module")
+def clean_state_json() -> str:
+    """Initialized state with a CA and roles but NO k8s resources, serialized.
 
-    # Create state with NO k8s resources (clean state)
+    Built and serialized once per module. State is a mutable dataclass, so
+    initialized_state hands each test its own copy parsed from this snapshot
+    (the same bytes it seeds into S3) rather than sharing one instance.
+    """
     state = State(
         namespace="default",
         region="us-east-1",
@@ -142,34 +133,93 @@ def initialized_state(aws_context: AwsContext) -> State:
         k8s_clusters={},
         k8s_workloads={},
     )
+    return state.to_json()
+
+
+@pytest.fixture
+def initialized_state(aws_context: AwsContext, clean_state_json: str, shared_ca: KeyPair) -> State:
+    """Create an initialized state with CA and roles."""
+    # Invalidate any cached state first
+    state_module.invalidate_cache("default")
+
+    # Create S3 bucket
+    aws_context.s3.create_bucket(Bucket="test-bucket")
+
+    # Upload CA cert to scoped S3 path
+    aws_context.s3.put_object(
+        Bucket="test-bucket",
+        Key="default/scopes/default/ca/certificate.pem",
+        Body=shared_ca.certificate.encode(),
+    )
+
+    # Create SSM parameter
+    aws_context.ssm.put_parameter(
+        Name="/iam-ra/default/state-location",
+        Value="s3://test-bucket/default/state.json",
+        Type="String",
+    )
 
     # Save state
     aws_context.s3.put_object(
         Bucket="test-bucket",
         Key="default/state.json",
-        Body=state.to_json().encode(),
+        Body=clean_state_json.encode(),
     )
 
-    return state
+    return State.from_json(clean_state_json)
+
+
+@pytest.fixture
+def prod_cluster(aws_context: AwsContext, initialized_state: State) -> State:
+    """initialized_state with a "prod" cluster already registered.
+
+    Seeds the cluster straight into S3 so tests that are about onboard,
+    offboard or teardown don't run the setup workflow as a preamble.
+    """
+    initialized_state.k8s_clusters["prod"] = K8sCluster(name="prod")
+    aws_context.s3.put_object(
+        Bucket="test-bucket",
+        Key="default/state.json",
+        Body=initialized_state.to_json().encode(),
+    )
+    return initialized_state
 
 
 # =============================================================================
 # Manifest Generation Tests
 # =============================================================================
 
+# libyaml's loader when PyYAML was built with it, the pure-Python one otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse(manifest: str) -> dict:
+    """Parse a single-document manifest for structural assertions."""
+    return yaml.load(manifest, Loader=_YamlLoader)
+
+
+def _missing(rendered: str, tokens: Iterable[str]) -> list[str]:
+    """Tokens absent from the rendered YAML (empty when all are present)."""
+    return [t for t in tokens if t not in rendered]
+
+
+CA_CERT_TOKENS = ("BEGIN CERTIFICATE", "END CERTIFICATE")
+CA_KEY_TOKENS = ("BEGIN EC PRIVATE KEY", "END EC PRIVATE KEY")
+CLUSTER_KIND_TOKENS = ("kind: Secret", "kind: Issuer")
+WORKLOAD_KIND_TOKENS = ("kind: Certificate", "kind: ConfigMap")
+
 
 class TestGenerateCaSecret:
     """Tests for generate_ca_secret."""
 
     def test_generates_valid_yaml(self):
         """Should generate valid K8s Secret YAML."""
-        result = generate_ca_secret(SAMPLE_CA_CERT, SAMPLE_CA_KEY)
+        doc = _parse(generate_ca_secret(SAMPLE_CA_CERT, SAMPLE_CA_KEY))
 
-        assert "apiVersion: v1" in result
-        assert "kind: Secret" in result
-        assert "type: kubernetes.io/tls" in result
-        assert "tls.crt:" in result
-        assert "tls.key:" in result
+        assert doc["apiVersion"] == "v1"
+        assert doc["kind"] == "Secret"
+        assert doc["type"] == "kubernetes.io/tls"
+        assert set(doc["stringData"]) == {"tls.crt", "tls.key"}
 
     def test_uses_default_name(self):
         """Should use default name if not specified."""
@@ -189,14 +239,12 @@ class TestGenerateCaSecret:
     def test_includes_certificate(self):
         """Should include the CA certificate."""
         result = generate_ca_secret(SAMPLE_CA_CERT, SAMPLE_CA_KEY)
-        assert "BEGIN CERTIFICATE" in result
-        assert "END CERTIFICATE" in result
+        assert not _missing(result, CA_CERT_TOKENS)
 
     def test_includes_private_key(self):
         """Should include the CA private key."""
         result = generate_ca_secret(SAMPLE_CA_CERT, SAMPLE_CA_KEY)
-        assert "BEGIN EC PRIVATE KEY" in result
-        assert "END EC PRIVATE KEY" in result
+        assert not _missing(result, CA_KEY_TOKENS)
 
 
 class TestGenerateIssuer:
@@ -204,10 +252,10 @@ class TestGenerateIssuer:
 
     def test_generates_valid_yaml(self):
         """Should generate valid cert-manager Issuer YAML."""
-        result = generate_issuer()
+        doc = _parse(generate_issuer())
 
-        assert "apiVersion: cert-manager.io/v1" in result
-        assert "kind: Issuer" in result
+        assert doc["apiVersion"] == "cert-manager.io/v1"
+        assert doc["kind"] == "Issuer"
 
     def test_uses_default_name(self):
         """Should use default name if not specified."""
@@ -225,36 +273,40 @@ class TestGenerateCertificate:
 
     def test_generates_valid_yaml(self):
         """Should generate valid cert-manager Certificate YAML."""
-        result = generate_certificate("my-app")
-
-        assert "apiVersion: cert-manager.io/v1" in result
-        assert "kind: Certificate" in result
-
-    def test_uses_workload_name_in_naming(self):
-        """Should use workload name for cert and secret names."""
-        result = generate_certificate("payment-service")
-        assert "name: payment-service-cert" in result
-        assert "secretName: payment-service-cert" in result
-
-    def test_sets_common_name(self):
-        """Should set CN to workload name by default."""
-        result = generate_certificate("my-app")
-        assert 'commonName: "my-app"' in result
-
-    def test_uses_custom_duration(self):
-        """Should use custom duration if specified."""
-        result = generate_certificate("my-app", duration_hours=12)
-        assert "duration: 12h0m0s" in result
-
-    def test_uses_default_duration(self):
-        """Should use default duration."""
-        result = generate_certificate("my-app")
-        assert f"duration: {DEFAULT_CERT_DURATION_HOURS}h0m0s" in result
-
-    def test_references_issuer(self):
-        """Should reference the specified issuer."""
-        result = generate_certificate("my-app", issuer_name="custom-issuer")
-        assert "name: custom-issuer" in result
+        doc = _parse(generate_certificate("my-app"))
+
+        assert doc["apiVersion"] == "cert-manager.io/v1"
+        assert doc["kind"] == "Certificate"
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_substrings",
+        [
+            pytest.param(
+                {"workload_name": "payment-service"},
+                ["name: payment-service-cert", "secretName: payment-service-cert"],
+                id="workload_name_in_naming",
+            ),
+            pytest.param(
+                {"workload_name": "my-app"},
+                ['commonName: "my-app"', f"duration: {DEFAULT_CERT_DURATION_HOURS}h0m0s"],
+                id="default_common_name_and_duration",
+            ),
+            pytest.param(
+                {"workload_name": "my-app", "duration_hours": 12},
+                ["duration: 12h0m0s"],
+                id="custom_duration",
+            ),
+            pytest.param(
+                {"workload_name": "my-app", "issuer_name": "custom-issuer"},
+                ["name: custom-issuer"],
+                id="references_issuer",
+            ),
+        ],
+    )
+    def test_certificate(self, kwargs, expected_substrings):
+        """Rendered Certificate should reflect the given (or default) parameters."""
+        result = generate_certificate(**kwargs)
+        assert not _missing(result, expected_substrings)
 
 
 class TestGenerateConfigMap:
@@ -262,33 +314,44 @@ class TestGenerateConfigMap:
 
     def test_generates_valid_yaml(self):
         """Should generate valid K8s ConfigMap YAML."""
-        result = generate_configmap(
-            "my-app",
-            "arn:aws:rolesanywhere:us-east-1:123:trust-anchor/ta",
-            "arn:aws:rolesanywhere:us-east-1:123:profile/p",
-            "arn:aws:iam::123:role/r",
+        doc = _parse(
+            generate_configmap(
+                "my-app",
+                "arn:aws:rolesanywhere:us-east-1:123:trust-anchor/ta",
+                "arn:aws:rolesanywhere:us-east-1:123:profile/p",
+                "arn:aws:iam::123:role/r",
+            )
         )
 
-        assert "apiVersion: v1" in result
-        assert "kind: ConfigMap" in result
+        assert doc["apiVersion"] == "v1"
+        assert doc["kind"] == "ConfigMap"
 
     def test_includes_all_arns(self):
         """Should include all ARNs."""
-        result = generate_configmap(
-            "my-app",
-            "trust-anchor-arn",
-            "profile-arn",
-            "role-arn",
+        doc = _parse(
+            generate_configmap(
+                "my-app",
+                "trust-anchor-arn",
+                "profile-arn",
+                "role-arn",
+            )
         )
 
-        assert "TRUST_ANCHOR_ARN" in result
-        assert "PROFILE_ARN" in result
-        assert "ROLE_ARN" in result
+        assert doc["data"] == {
+            "TRUST_ANCHOR_ARN": "trust-anchor-arn",
+            "PROFILE_ARN": "profile-arn",
+            "ROLE_ARN": "role-arn",
+        }
 
     def test_uses_workload_name(self):
         """Should use workload name in configmap name."""
-        result = generate_configmap("payment-service", "ta", "p", "r")
-        assert "name: payment-service-iam-ra-config" in result
+        doc = _parse(generate_configmap("payment-service", "ta", "p", "r"))
+        assert doc["metadata"]["name"] == "payment-service-iam-ra-config"
+
+    def test_repeat_render_is_memoized(self):
+        """Same inputs should return the cached render, not a new string."""
+        first = generate_configmap("memo-app", "ta", "p", "r")
+        assert generate_configmap("memo-app", "ta", "p", "r") is first
 
 
 class TestGenerateSamplePod:
@@ -296,10 +359,10 @@ class TestGenerateSamplePod:
 
     def test_generates_valid_yaml(self):
         """Should generate valid K8s Pod YAML."""
-        result = generate_sample_pod("my-app")
+        doc = _parse(generate_sample_pod("my-app"))
 
-        assert "apiVersion: v1" in result
-        assert "kind: Pod" in result
+        assert doc["apiVersion"] == "v1"
+        assert doc["kind"] == "Pod"
 
     def test_includes_app_container(self):
         """Should include application container."""
@@ -313,15 +376,21 @@ class TestGenerateSamplePod:
 
     def test_sets_metadata_endpoint(self):
         """Should configure IMDS endpoint env var."""
-        result = generate_sample_pod("my-app")
-        assert "AWS_EC2_METADATA_SERVICE_ENDPOINT" in result
-        assert "http://127.0.0.1:9911/" in result
+        doc = _parse(generate_sample_pod("my-app"))
+        app = next(c for c in doc["spec"]["containers"] if c["name"] == "app")
+        env = {e["name"]: e["value"] for e in app["env"]}
+        assert env["AWS_EC2_METADATA_SERVICE_ENDPOINT"] == "http://127.0.0.1:9911/"
 
     def test_mounts_cert_volume(self):
         """Should mount certificate volume."""
-        result = generate_sample_pod("my-app")
-        assert "iam-ra-cert" in result
-        assert "/var/run/secrets/iam-ra" in result
+        doc = _parse(generate_sample_pod("my-app"))
+        sidecar = next(c for c in doc["spec"]["containers"] if c["name"] == "iam-ra-sidecar")
+        mount = sidecar["volumeMounts"][0]
+        assert mount["name"] == "iam-ra-cert"
+        assert mount["mountPath"] == "/var/run/secrets/iam-ra"
+        assert doc["spec"]["volumes"] == [
+            {"name": "iam-ra-cert", "secret": {"secretName": "my-app-cert"}}
+        ]
 
 
 class TestGenerateClusterManifests:
@@ -337,11 +406,10 @@ class TestGenerateClusterManifests:
     def test_to_yaml_combines_manifests(self):
         """Should combine manifests with separator."""
         result = generate_cluster_manifests(SAMPLE_CA_CERT, SAMPLE_CA_KEY)
-        yaml = result.to_yaml()
+        combined = result.to_yaml()
 
-        assert "---" in yaml
-        assert "kind: Secret" in yaml
-        assert "kind: Issuer" in yaml
+        assert "---" in combined
+        assert not _missing(combined, CLUSTER_KIND_TOKENS)
 
 
 class TestGenerateWorkloadManifests:
@@ -369,12 +437,10 @@ class TestGenerateWorkloadManifests:
             "profile-arn",
             "role-arn",
         )
-        yaml = result.to_yaml()
+        combined = result.to_yaml()
 
-        assert yaml.count("---") == 2
-        assert "kind: Certificate" in yaml
-        assert "kind: ConfigMap" in yaml
-        assert "kind: Pod" in yaml
+        assert combined.count("---") == 2
+        assert not _missing(combined, (*WORKLOAD_KIND_TOKENS, "kind: Pod"))
 
     def test_no_sample_pod(self):
         """Should omit sample Pod when include_sample_pod=False."""
@@ -397,12 +463,11 @@ class TestGenerateWorkloadManifests:
             "role-arn",
             include_sample_pod=False,
         )
-        yaml = result.to_yaml()
+        combined = result.to_yaml()
 
-        assert yaml.count("---") == 1
-        assert "kind: Certificate" in yaml
-        assert "kind: ConfigMap" in yaml
-        assert "kind: Pod" not in yaml
+        assert combined.count("---") == 1
+        assert not _missing(combined, WORKLOAD_KIND_TOKENS)
+        assert "kind: Pod" not in combined
 
     def test_same_namespace_no_cluster_manifests(self):
         """Should NOT include cluster manifests when workload is in the same namespace."""
@@ -452,17 +517,14 @@ class TestGenerateWorkloadManifests:
             ca_key_pem=SAMPLE_CA_KEY,
             include_sample_pod=False,
         )
-        yaml = result.to_yaml()
+        combined = result.to_yaml()
 
-        assert "kind: Secret" in yaml
-        assert "kind: Issuer" in yaml
-        assert "kind: Certificate" in yaml
-        assert "kind: ConfigMap" in yaml
+        assert not _missing(combined, (*CLUSTER_KIND_TOKENS, *WORKLOAD_KIND_TOKENS))
 
         # Cluster manifests should appear before workload manifests
-        secret_pos = yaml.index("kind: Secret")
-        issuer_pos = yaml.index("kind: Issuer")
-        cert_pos = yaml.index("kind: Certificate")
+        secret_pos = combined.index("kind: Secret")
+        issuer_pos = combined.index("kind: Issuer")
+        cert_pos = combined.index("kind: Certificate")
         assert secret_pos < issuer_pos < cert_pos
 
     def test_cross_namespace_without_ca_material(self):
@@ -528,9 +590,8 @@ class TestSetup:
 class TestTeardown:
     """Tests for k8s teardown workflow."""
 
-    def test_teardown_removes_cluster(self, aws_context, initialized_state):
+    def test_teardown_removes_cluster(self, aws_context, prod_cluster):
         """Should remove cluster from state."""
-        setup(aws_context, "default", "prod")
         result = teardown(aws_context, "default", "prod")
 
         assert isinstance(result, Ok)
@@ -543,9 +604,8 @@ class TestTeardown:
         result = teardown(aws_context, "default", "nonexistent")
         assert isinstance(result, Err)
 
-    def test_teardown_fails_if_cluster_in_use(self, aws_context, initialized_state):
+    def test_teardown_fails_if_cluster_in_use(self, aws_context, prod_cluster):
         """Should fail if cluster has workloads."""
-        setup(aws_context, "default", "prod")
         onboard(aws_context, "default", "my-app", "prod", "admin")
 
         result = teardown(aws_context, "default", "prod")
@@ -555,9 +615,8 @@ class TestTeardown:
 class TestOnboard:
     """Tests for k8s onboard workflow."""
 
-    def test_onboard_creates_workload(self, aws_context, initialized_state):
+    def test_onboard_creates_workload(self, aws_context, prod_cluster):
         """Should create workload and return manifests."""
-        setup(aws_context, "default", "prod")
         result = onboard(aws_context, "default", "my-app", "prod", "admin")
 
         assert isinstance(result, Ok)
@@ -570,15 +629,13 @@ class TestOnboard:
         result = onboard(aws_context, "default", "my-app", "nonexistent", "admin")
         assert isinstance(result, Err)
 
-    def test_onboard_fails_if_role_not_found(self, aws_context, initialized_state):
+    def test_onboard_fails_if_role_not_found(self, aws_context, prod_cluster):
         """Should fail if role doesn't exist."""
-        setup(aws_context, "default", "prod")
         result = onboard(aws_context, "default", "my-app", "prod", "nonexistent")
         assert isinstance(result, Err)
 
-    def test_onboard_is_idempotent(self, aws_context, initialized_state):
+    def test_onboard_is_idempotent(self, aws_context, prod_cluster):
         """Should succeed if workload already exists (idempotent) with identical YAML."""
-        setup(aws_context, "default", "prod")
         result1 = onboard(aws_context, "default", "my-app", "prod", "admin")
         assert isinstance(result1, Ok)
 
@@ -594,9 +651,8 @@ class TestOnboard:
         assert isinstance(list_result, Ok)
         assert len(list_result.value.workloads) == 1
 
-    def test_onboard_manifests_include_correct_arns(self, aws_context, initialized_state):
+    def test_onboard_manifests_include_correct_arns(self, aws_context, prod_cluster):
         """Should include correct ARNs in manifests."""
-        setup(aws_context, "default", "prod")
         result = onboard(aws_context, "default", "my-app", "prod", "admin")
 
         assert isinstance(result, Ok)
@@ -605,9 +661,8 @@ class TestOnboard:
         assert "profile/admin-profile" in configmap
         assert "role/admin" in configmap
 
-    def test_onboard_always_includes_cluster_manifests(self, aws_context, initialized_state):
+    def test_onboard_always_includes_cluster_manifests(self, aws_context, prod_cluster):
         """Onboard should always include CA Secret + Issuer for the workload namespace."""
-        setup(aws_context, "default", "prod")
         result = onboard(
             aws_context, "default", "my-app", "prod", "admin", k8s_namespace="cert-manager"
         )
@@ -621,9 +676,8 @@ class TestOnboard:
 class TestOffboard:
     """Tests for k8s offboard workflow."""
 
-    def test_offboard_removes_workload(self, aws_context, initialized_state):
+    def test_offboard_removes_workload(self, aws_context, prod_cluster):
         """Should remove workload from state."""
-        setup(aws_context, "default", "prod")
         onboard(aws_context, "default", "my-app", "prod", "admin")
 
         result = offboard(aws_context, "default", "my-app")
@@ -699,56 +753,34 @@ IPq3pPTbbMOQ2NwlKgrosN9MzKZM5BPCertMgr==
 -----END EC PRIVATE KEY-----"""
 
 
-@pytest.fixture
-def scoped_aws_context(monkeypatch):
-    """Create an AwsContext with multiple scoped CAs on disk."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = Path(tmpdir) / "data"
-        data_dir.mkdir()
-        monkeypatch.setenv("XDG_DATA_HOME", str(data_dir))
-
-        # Default scope CA key
-        default_key_dir = data_dir / "iam-ra" / "default" / "scopes" / "default"
-        default_key_dir.mkdir(parents=True)
-        (default_key_dir / "ca-private-key.pem").write_text(SAMPLE_CA_KEY)
-
-        # cert-manager scope CA key (different key!)
-        certmgr_key_dir = data_dir / "iam-ra" / "default" / "scopes" / "cert-manager"
-        certmgr_key_dir.mkdir(parents=True)
-        (certmgr_key_dir / "ca-private-key.pem").write_text(SAMPLE_CERTMGR_CA_KEY)
-
-        with mock_aws():
-            ctx = AwsContext(region="us-east-1")
-            yield ctx
+@pytest.fixture(scope="module")
+def scoped_data_dir(tmp_path_factory, shared_ca: KeyPair) -> Path:
+    """XDG data dir with CA keys for two scopes, written once per module."""
+    data_dir = tmp_path_factory.mktemp("iamra_scoped_data")
 
+    # Default scope CA key
+    default_key_dir = data_dir / "iam-ra" / "default" / "scopes" / "default"
+    default_key_dir.mkdir(parents=True)
+    (default_key_dir / "ca-private-key.pem").write_text(shared_ca.private_key)
 
-@pytest.fixture
-def multi_scope_state(scoped_aws_context: AwsContext) -> State:
-    """Create state with multiple scoped CAs and roles in different scopes."""
-    state_module.invalidate_cache("default")
+    # cert-manager scope CA key (different key!)
+    certmgr_key_dir = data_dir / "iam-ra" / "default" / "scopes" / "cert-manager"
+    certmgr_key_dir.mkdir(parents=True)
+    (certmgr_key_dir / "ca-private-key.pem").write_text(SAMPLE_CERTMGR_CA_KEY)
 
-    scoped_aws_context.s3.create_bucket(Bucket="test-bucket")
+    return data_dir
 
-    # Upload default scope CA cert
-    scoped_aws_context.s3.put_object(
-        Bucket="test-bucket",
-        Key="default/scopes/default/ca/certificate.pem",
-        Body=SAMPLE_CA_CERT.encode(),
-    )
 
-    # Upload cert-manager scope CA cert (different cert!)
-    scoped_aws_context.s3.put_object(
-        Bucket="test-bucket",
-        Key="default/scopes/cert-manager/ca/certificate.pem",
-        Body=SAMPLE_CERTMGR_CA_CERT.encode(),
-    )
+@pytest.fixture
+def scoped_aws_context(monkeypatch, moto_backends, scoped_data_dir: Path) -> AwsContext:
+    """Create an AwsContext with multiple scoped CAs on disk."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(scoped_data_dir))
+    return AwsContext(region="us-east-1")
 
-    scoped_aws_context.ssm.put_parameter(
-        Name="/iam-ra/default/state-location",
-        Value="s3://test-bucket/default/state.json",
-        Type="String",
-    )
 
+@pytest.fixture(scope="module")
+def multi_scope_state_json() -> str:
+    """Serialized state with two scoped CAs and a role in each, built once per module."""
     state = State(
         namespace="default",
         region="us-east-1",
@@ -795,14 +827,45 @@ def multi_scope_state(scoped_aws_context: AwsContext) -> State:
         k8s_clusters={},
         k8s_workloads={},
     )
+    return state.to_json()
+
+
+@pytest.fixture
+def multi_scope_state(
+    scoped_aws_context: AwsContext, multi_scope_state_json: str, shared_ca: KeyPair
+) -> State:
+    """Create state with multiple scoped CAs and roles in different scopes."""
+    state_module.invalidate_cache("default")
+
+    scoped_aws_context.s3.create_bucket(Bucket="test-bucket")
+
+    # Upload default scope CA cert
+    scoped_aws_context.s3.put_object(
+        Bucket="test-bucket",
+        Key="default/scopes/default/ca/certificate.pem",
+        Body=shared_ca.certificate.encode(),
+    )
+
+    # Upload cert-manager scope CA cert (different cert!)
+    scoped_aws_context.s3.put_object(
+        Bucket="test-bucket",
+        Key="default/scopes/cert-manager/ca/certificate.pem",
+        Body=SAMPLE_CERTMGR_CA_CERT.encode(),
+    )
+
+    scoped_aws_context.ssm.put_parameter(
+        Name="/iam-ra/default/state-location",
+        Value="s3://test-bucket/default/state.json",
+        Type="String",
+    )
 
     scoped_aws_context.s3.put_object(
         Bucket="test-bucket",
         Key="default/state.json",
-        Body=state.to_json().encode(),
+        Body=multi_scope_state_json.encode(),
     )
 
-    return state
+    return State.from_json(multi_scope_state_json)
 
 
 class TestOnboardWithScope:
@@ -956,7 +1019,7 @@ class TestOnboardWithScope:
 class TestSetupSimplified:
     """Tests for simplified k8s setup (just registers cluster)."""
 
-    def test_setup_works_without_ca_key_on_disk(self, monkeypatch):
+    def test_setup_works_without_ca_key_on_disk(self, monkeypatch, moto_backends):
         """Setup should work without needing CA key on disk (no manifests generated)."""
         with tempfile.TemporaryDirectory() as tmpdir:
             data_dir = Path(tmpdir) / "data"
@@ -964,44 +1027,43 @@ class TestSetupSimplified:
             monkeypatch.setenv("XDG_DATA_HOME", str(data_dir))
             # Deliberately NOT creating any CA key files
 
-            with mock_aws():
-                ctx = AwsContext(region="us-east-1")
-
-                state_module.invalidate_cache("default")
-                ctx.s3.create_bucket(Bucket="test-bucket")
-                ctx.ssm.put_parameter(
-                    Name="/iam-ra/default/state-location",
-                    Value="s3://test-bucket/default/state.json",
-                    Type="String",
-                )
-
-                state = State(
-                    namespace="default",
-                    region="us-east-1",
-                    version="1.0.0",
-                    init=Init(
-                        stack_name="iam-ra-default-init",
-                        bucket_arn=Arn("arn:aws:s3:::test-bucket"),
-                        kms_key_arn=Arn("arn:aws:kms:us-east-1:123456789012:key/test-key"),
-                    ),
-                    cas={
-                        "default": CA(
-                            stack_name="iam-ra-default-ca",
-                            mode=CAMode.SELF_SIGNED,
-                            trust_anchor_arn=Arn(
-                                "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta-123"
-                            ),
+            ctx = AwsContext(region="us-east-1")
+
+            state_module.invalidate_cache("default")
+            ctx.s3.create_bucket(Bucket="test-bucket")
+            ctx.ssm.put_parameter(
+                Name="/iam-ra/default/state-location",
+                Value="s3://test-bucket/default/state.json",
+                Type="String",
+            )
+
+            state = State(
+                namespace="default",
+                region="us-east-1",
+                version="1.0.0",
+                init=Init(
+                    stack_name="iam-ra-default-init",
+                    bucket_arn=Arn("arn:aws:s3:::test-bucket"),
+                    kms_key_arn=Arn("arn:aws:kms:us-east-1:123456789012:key/test-key"),
+                ),
+                cas={
+                    "default": CA(
+                        stack_name="iam-ra-default-ca",
+                        mode=CAMode.SELF_SIGNED,
+                        trust_anchor_arn=Arn(
+                            "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta-123"
                         ),
-                    },
-                )
+                    ),
+                },
+            )
 
-                ctx.s3.put_object(
-                    Bucket="test-bucket",
-                    Key="default/state.json",
-                    Body=state.to_json().encode(),
-                )
+            ctx.s3.put_object(
+                Bucket="test-bucket",
+                Key="default/state.json",
+                Body=state.to_json().encode(),
+            )
 
-                result = setup(ctx, "default", "new-cluster")
+            result = setup(ctx, "default", "new-cluster")
 
-                assert isinstance(result, Ok)
-                assert result.value.cluster.name == "new-cluster"
+            assert isinstance(result, Ok)
+            assert result.value.cluster.name == "new-cluster"
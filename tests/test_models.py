@@ -1,52 +1,211 @@
 """Tests for models - Arn, State, and related data structures."""
 
 import json
+from collections.abc import Callable
+from dataclasses import asdict, replace
 
 import pytest
 
-from iam_ra_cli.models import CA, Arn, CAMode, Host, Init, K8sCluster, K8sWorkload, Role, State
+from iam_ra_cli.models import (
+    CA,
+    Arn,
+    CAMode,
+    Host,
+    Init,
+    K8sCluster,
+    K8sWorkload,
+    Role,
+    State,
+    intern_arn,
+)
+
+# Every distinct ARN used below, parsed once per module.
+_ARN_TEST_BUCKET = Arn("arn:aws:s3:::test-bucket")
+_ARN_BUCKET = Arn("arn:aws:s3:::bucket")
+_ARN_KMS_TEST_KEY = Arn("arn:aws:kms:ap-southeast-2:123456789012:key/test-key")
+_ARN_KMS_KEY = Arn("arn:aws:kms:ap-southeast-2:123456789012:key/key")
+_ARN_TA_DEFAULT = Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-default")
+_ARN_TA_CM = Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm")
+_ARN_TA_123 = Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123")
+_ARN_PCA = Arn("arn:aws:acm-pca:ap-southeast-2:123456789012:certificate-authority/ca-123")
+_ARN_ROLE_ADMIN = Arn("arn:aws:iam::123456789012:role/iam-ra-test-admin")
+_ARN_ROLE_TEST = Arn("arn:aws:iam::123456789012:role/test")
+_ARN_PROFILE_P123 = Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-123")
+_ARN_PROFILE_123 = Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/profile-123")
+_ARN_PROFILE_TEST = Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/test")
+_ARN_POLICY_ADMIN = Arn("arn:aws:iam::aws:policy/AdministratorAccess")
+_ARN_POLICY_READONLY = Arn("arn:aws:iam::aws:policy/ReadOnlyAccess")
+_ARN_SECRET_CERT = Arn("arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:cert")
+_ARN_SECRET_KEY = Arn("arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:key")
+_ARN_SECRET_CERT_SUFFIXED = Arn(
+    "arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:cert-AbCdEf"
+)
+_ARN_SECRET_KEY_SUFFIXED = Arn(
+    "arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:key-AbCdEf"
+)
+
+# Canonical model objects. All of these are frozen, so one instance per
+# module is shared by every test that needs "a" CA/role/host rather than
+# rebuilding (and re-parsing the ARNs of) the same object in each test.
+
+
+@pytest.fixture(scope="module")
+def sample_init() -> Init:
+    return Init(
+        stack_name="iam-ra-test-init",
+        bucket_arn=_ARN_TEST_BUCKET,
+        kms_key_arn=_ARN_KMS_TEST_KEY,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_ca() -> CA:
+    return CA(
+        stack_name="iam-ra-test-ca-default",
+        mode=CAMode.SELF_SIGNED,
+        trust_anchor_arn=_ARN_TA_DEFAULT,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_ca_scoped() -> CA:
+    return CA(
+        stack_name="iam-ra-test-ca-cert-manager",
+        mode=CAMode.SELF_SIGNED,
+        trust_anchor_arn=_ARN_TA_CM,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_role() -> Role:
+    return Role(
+        stack_name="iam-ra-test-role-admin",
+        role_arn=_ARN_ROLE_ADMIN,
+        profile_arn=_ARN_PROFILE_P123,
+        policies=(_ARN_POLICY_ADMIN,),
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_host() -> Host:
+    return Host(
+        stack_name="iam-ra-test-host-web1",
+        hostname="web1",
+        role_name="admin",
+        certificate_secret_arn=_ARN_SECRET_CERT,
+        private_key_secret_arn=_ARN_SECRET_KEY,
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_state() -> State:
+    """Bare, uninitialized state. Tests must not mutate it."""
+    return State(namespace="test", region="us-east-1", version="2.0.0")
+
+
+@pytest.fixture(scope="module")
+def fully_populated_state(
+    sample_init: Init, sample_ca: CA, sample_role: Role, sample_host: Host
+) -> State:
+    """Initialized state with one CA, role and host. Tests must not mutate it."""
+    return State(
+        namespace="test",
+        region="ap-southeast-2",
+        version="0.1.0",
+        init=sample_init,
+        cas={"default": sample_ca},
+        roles={"admin": sample_role},
+        hosts={"web1": sample_host},
+    )
+
+
+@pytest.fixture(scope="module")
+def scoped_cas_state(fully_populated_state: State, sample_ca_scoped: CA) -> State:
+    return replace(
+        fully_populated_state,
+        cas={**fully_populated_state.cas, "cert-manager": sample_ca_scoped},
+        roles={},
+        hosts={},
+    )
+
+
+@pytest.fixture(scope="module")
+def scoped_role_state(fully_populated_state: State, sample_role: Role) -> State:
+    return replace(
+        fully_populated_state,
+        cas={},
+        roles={"cert-manager": replace(sample_role, scope="cert-manager")},
+        hosts={},
+    )
 
 
 class TestArn:
     """Tests for Arn class."""
 
-    def test_valid_arn_parsing(self) -> None:
-        arn = Arn("arn:aws:s3:::my-bucket")
-        assert arn.arn_partition == "aws"
-        assert arn.service == "s3"
-        assert arn.region == ""
-        assert arn.account == ""
-        assert arn.resource == "my-bucket"
-
-    def test_arn_with_all_parts(self) -> None:
-        arn = Arn("arn:aws:iam::123456789012:role/my-role")
-        assert arn.arn_partition == "aws"
-        assert arn.service == "iam"
-        assert arn.region == ""
-        assert arn.account == "123456789012"
-        assert arn.resource == "role/my-role"
-        assert arn.resource_type == "role"
-        assert arn.resource_id == "my-role"
-
-    def test_arn_with_region(self) -> None:
-        arn = Arn("arn:aws:ssm:ap-southeast-2:123456789012:parameter/my-param")
-        assert arn.region == "ap-southeast-2"
-        assert arn.account == "123456789012"
-        assert arn.resource_type == "parameter"
-        assert arn.resource_id == "my-param"
-
-    def test_arn_with_colon_separator(self) -> None:
-        arn = Arn("arn:aws:secretsmanager:us-east-1:123456789012:secret:my-secret-AbCdEf")
-        assert arn.resource_type == "secret"
-        assert arn.resource_id == "my-secret-AbCdEf"
-
-    def test_invalid_arn_raises(self) -> None:
-        with pytest.raises(ValueError, match="Invalid ARN"):
-            Arn("not-an-arn")
+    @pytest.mark.parametrize(
+        "arn_str, expected",
+        [
+            pytest.param(
+                "arn:aws:s3:::my-bucket",
+                {
+                    "arn_partition": "aws",
+                    "service": "s3",
+                    "region": "",
+                    "account": "",
+                    "resource": "my-bucket",
+                },
+                id="no_region_no_account",
+            ),
+            pytest.param(
+                "arn:aws:iam::123456789012:role/my-role",
+                {
+                    "arn_partition": "aws",
+                    "service": "iam",
+                    "region": "",
+                    "account": "123456789012",
+                    "resource": "role/my-role",
+                    "resource_type": "role",
+                    "resource_id": "my-role",
+                },
+                id="all_parts",
+            ),
+            pytest.param(
+                "arn:aws:ssm:ap-southeast-2:123456789012:parameter/my-param",
+                {
+                    "region": "ap-southeast-2",
+                    "account": "123456789012",
+                    "resource_type": "parameter",
+                    "resource_id": "my-param",
+                },
+                id="with_region",
+            ),
+            pytest.param(
+                "arn:aws:secretsmanager:us-east-1:123456789012:secret:my-secret-AbCdEf",
+                {"resource_type": "secret", "resource_id": "my-secret-AbCdEf"},
+                id="colon_separator",
+            ),
+        ],
+    )
+    def test_arn_fields(self, arn_str: str, expected: dict[str, str]) -> None:
+        arn = Arn(arn_str)
+        assert {attr: getattr(arn, attr) for attr in expected} == expected
 
-    def test_arn_missing_parts_raises(self) -> None:
+    @pytest.mark.parametrize("arn_str", ["not-an-arn", "arn:aws:s3"])
+    def test_invalid_arn_raises(self, arn_str: str) -> None:
         with pytest.raises(ValueError, match="Invalid ARN"):
-            Arn("arn:aws:s3")
+            Arn(arn_str)
+
+    def test_intern_arn_shares_instances(self) -> None:
+        value = "arn:aws:iam::aws:policy/AdministratorAccess"
+        arn = intern_arn(value)
+        assert type(arn) is Arn
+        assert arn == value
+        assert intern_arn(value) is arn
+
+    def test_from_json_interns_repeated_arns(self, empty_state: State, sample_role: Role) -> None:
+        state = replace(empty_state, roles={"a": sample_role, "b": sample_role})
+        restored = State.from_json(state.to_json())
+        assert restored.roles["a"].policies[0] is restored.roles["b"].policies[0]
 
     def test_arn_is_string(self) -> None:
         arn = Arn("arn:aws:s3:::my-bucket")
@@ -58,19 +217,17 @@ class TestArn:
 class TestCAMode:
     """Tests for CAMode enum."""
 
-    def test_self_signed_value(self) -> None:
-        assert CAMode.SELF_SIGNED.value == "self-signed"
-
-    def test_pca_new_value(self) -> None:
-        assert CAMode.PCA_NEW.value == "pca-new"
-
-    def test_pca_existing_value(self) -> None:
-        assert CAMode.PCA_EXISTING.value == "pca-existing"
-
-    def test_from_string(self) -> None:
-        assert CAMode("self-signed") == CAMode.SELF_SIGNED
-        assert CAMode("pca-new") == CAMode.PCA_NEW
-        assert CAMode("pca-existing") == CAMode.PCA_EXISTING
+    @pytest.mark.parametrize(
+        "value, member",
+        [
+            ("self-signed", CAMode.SELF_SIGNED),
+            ("pca-new", CAMode.PCA_NEW),
+            ("pca-existing", CAMode.PCA_EXISTING),
+        ],
+    )
+    def test_enum_mapping(self, value: str, member: CAMode) -> None:
+        assert CAMode(value) is member
+        assert member.value == value
 
 
 class TestInit:
@@ -79,8 +236,8 @@ class TestInit:
     def test_init_creation(self) -> None:
         init = Init(
             stack_name="iam-ra-test-init",
-            bucket_arn=Arn("arn:aws:s3:::test-bucket"),
-            kms_key_arn=Arn("arn:aws:kms:ap-southeast-2:123456789012:key/test-key"),
+            bucket_arn=_ARN_TEST_BUCKET,
+            kms_key_arn=_ARN_KMS_TEST_KEY,
         )
         assert init.stack_name == "iam-ra-test-init"
         assert init.bucket_arn.resource_id == "test-bucket"
@@ -88,8 +245,8 @@ class TestInit:
     def test_init_is_frozen(self) -> None:
         init = Init(
             stack_name="test",
-            bucket_arn=Arn("arn:aws:s3:::bucket"),
-            kms_key_arn=Arn("arn:aws:kms:ap-southeast-2:123456789012:key/key"),
+            bucket_arn=_ARN_BUCKET,
+            kms_key_arn=_ARN_KMS_KEY,
         )
         with pytest.raises(AttributeError):
             init.stack_name = "changed"
@@ -102,23 +259,19 @@ class TestCA:
         ca = CA(
             stack_name="iam-ra-test-rootca",
             mode=CAMode.SELF_SIGNED,
-            trust_anchor_arn=Arn(
-                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-            ),
+            trust_anchor_arn=_ARN_TA_123,
         )
-        assert ca.mode == CAMode.SELF_SIGNED
+        assert ca.mode is CAMode.SELF_SIGNED
         assert ca.pca_arn is None
 
     def test_ca_with_pca(self) -> None:
         ca = CA(
             stack_name="iam-ra-test-rootca",
             mode=CAMode.PCA_NEW,
-            trust_anchor_arn=Arn(
-                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-            ),
-            pca_arn=Arn("arn:aws:acm-pca:ap-southeast-2:123456789012:certificate-authority/ca-123"),
+            trust_anchor_arn=_ARN_TA_123,
+            pca_arn=_ARN_PCA,
         )
-        assert ca.mode == CAMode.PCA_NEW
+        assert ca.mode is CAMode.PCA_NEW
         assert ca.pca_arn is not None
 
 
@@ -128,23 +281,44 @@ class TestRole:
     def test_role_with_policies(self) -> None:
         role = Role(
             stack_name="iam-ra-test-role-admin",
-            role_arn=Arn("arn:aws:iam::123456789012:role/iam-ra-test-admin"),
-            profile_arn=Arn(
-                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/profile-123"
-            ),
+            role_arn=_ARN_ROLE_ADMIN,
+            profile_arn=_ARN_PROFILE_123,
             policies=(
-                Arn("arn:aws:iam::aws:policy/AdministratorAccess"),
-                Arn("arn:aws:iam::aws:policy/ReadOnlyAccess"),
+                _ARN_POLICY_ADMIN,
+                _ARN_POLICY_READONLY,
             ),
         )
         assert len(role.policies) == 2
-        assert all(isinstance(p, Arn) for p in role.policies)
+
+    def test_role_rejects_plain_string_policies(self) -> None:
+        with pytest.raises(TypeError, match="Role policies must be Arn"):
+            Role(
+                stack_name="test",
+                role_arn=_ARN_ROLE_TEST,
+                profile_arn=_ARN_PROFILE_TEST,
+                policies=("arn:aws:iam::aws:policy/ReadOnlyAccess",),
+            )
+
+    def test_role_policies_str(self) -> None:
+        role = Role(
+            stack_name="test",
+            role_arn=_ARN_ROLE_TEST,
+            profile_arn=_ARN_PROFILE_TEST,
+            policies=(_ARN_POLICY_READONLY,),
+        )
+        assert role.policies_str == ("arn:aws:iam::aws:policy/ReadOnlyAccess",)
+        assert all(type(p) is str for p in role.policies_str)
+
+        # Derived, not serialized
+        state = State(namespace="test", region="ap-southeast-2", version="2.0.0")
+        state.roles["test"] = role
+        assert "policies_str" not in json.loads(state.to_json())["roles"]["test"]
 
     def test_role_without_policies(self) -> None:
         role = Role(
             stack_name="test",
-            role_arn=Arn("arn:aws:iam::123456789012:role/test"),
-            profile_arn=Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/test"),
+            role_arn=_ARN_ROLE_TEST,
+            profile_arn=_ARN_PROFILE_TEST,
         )
         assert role.policies == ()
 
@@ -157,143 +331,39 @@ class TestHost:
             stack_name="iam-ra-test-host-web1",
             hostname="web1",
             role_name="admin",
-            certificate_secret_arn=Arn(
-                "arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:cert-AbCdEf"
-            ),
-            private_key_secret_arn=Arn(
-                "arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:key-AbCdEf"
-            ),
+            certificate_secret_arn=_ARN_SECRET_CERT_SUFFIXED,
+            private_key_secret_arn=_ARN_SECRET_KEY_SUFFIXED,
         )
-        assert host.hostname == "web1"
-        assert host.role_name == "admin"
+        assert (host.hostname, host.role_name) == ("web1", "admin")
 
 
 class TestState:
     """Tests for State dataclass."""
 
-    def test_state_uninitialized(self) -> None:
-        state = State(namespace="test", region="ap-southeast-2", version="0.1.0")
-        assert state.is_initialized is False
-        assert state.init is None
-        assert state.ca is None
-        assert state.roles == {}
-        assert state.hosts == {}
+    def test_state_uninitialized(self, empty_state: State) -> None:
+        state = empty_state
+        assert (state.is_initialized, state.init, state.ca, state.roles, state.hosts) == (
+            False,
+            None,
+            None,
+            {},
+            {},
+        )
 
-    def test_state_initialized_requires_init(self) -> None:
+    def test_state_initialized_requires_init(self, sample_init: Init) -> None:
         # No init → not initialized
-        state = State(
-            namespace="test",
-            region="ap-southeast-2",
-            version="0.1.0",
-        )
+        state = State(namespace="test", region="ap-southeast-2", version="0.1.0")
         assert state.is_initialized is False
 
         # With init → initialized (CAs are per-scope, not required for init)
-        state2 = State(
-            namespace="test",
-            region="ap-southeast-2",
-            version="0.1.0",
-            init=Init(
-                stack_name="init",
-                bucket_arn=Arn("arn:aws:s3:::bucket"),
-                kms_key_arn=Arn("arn:aws:kms:ap-southeast-2:123456789012:key/key"),
-            ),
-        )
-        assert state2.is_initialized is True
-
-    def test_state_fully_initialized(self) -> None:
-        state = State(
-            namespace="test",
-            region="ap-southeast-2",
-            version="0.1.0",
-            init=Init(
-                stack_name="init",
-                bucket_arn=Arn("arn:aws:s3:::bucket"),
-                kms_key_arn=Arn("arn:aws:kms:ap-southeast-2:123456789012:key/key"),
-            ),
-            cas={
-                "default": CA(
-                    stack_name="ca",
-                    mode=CAMode.SELF_SIGNED,
-                    trust_anchor_arn=Arn(
-                        "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta"
-                    ),
-                ),
-            },
-        )
+        state.init = sample_init
         assert state.is_initialized is True
 
-    def test_state_json_roundtrip(self) -> None:
-        original = State(
-            namespace="test",
-            region="ap-southeast-2",
-            version="0.1.0",
-            init=Init(
-                stack_name="iam-ra-test-init",
-                bucket_arn=Arn("arn:aws:s3:::test-bucket"),
-                kms_key_arn=Arn("arn:aws:kms:ap-southeast-2:123456789012:key/test-key"),
-            ),
-            cas={
-                "default": CA(
-                    stack_name="iam-ra-test-rootca",
-                    mode=CAMode.SELF_SIGNED,
-                    trust_anchor_arn=Arn(
-                        "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-                    ),
-                ),
-            },
-            roles={
-                "admin": Role(
-                    stack_name="iam-ra-test-role-admin",
-                    role_arn=Arn("arn:aws:iam::123456789012:role/iam-ra-test-admin"),
-                    profile_arn=Arn(
-                        "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-123"
-                    ),
-                    policies=(Arn("arn:aws:iam::aws:policy/AdministratorAccess"),),
-                )
-            },
-            hosts={
-                "web1": Host(
-                    stack_name="iam-ra-test-host-web1",
-                    hostname="web1",
-                    role_name="admin",
-                    certificate_secret_arn=Arn(
-                        "arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:cert"
-                    ),
-                    private_key_secret_arn=Arn(
-                        "arn:aws:secretsmanager:ap-southeast-2:123456789012:secret:key"
-                    ),
-                )
-            },
-        )
-
-        # Serialize and deserialize
-        json_str = original.to_json()
-        restored = State.from_json(json_str)
-
-        # Verify all fields
-        assert restored.namespace == original.namespace
-        assert restored.region == original.region
-        assert restored.version == original.version
-        assert restored.is_initialized is True
-
-        assert restored.init is not None
-        assert restored.init.stack_name == original.init.stack_name
-        assert isinstance(restored.init.bucket_arn, Arn)
+    def test_state_fully_initialized(self, fully_populated_state: State) -> None:
+        assert fully_populated_state.is_initialized is True
 
-        assert "default" in restored.cas
-        assert restored.cas["default"].mode == CAMode.SELF_SIGNED
-
-        assert "admin" in restored.roles
-        assert isinstance(restored.roles["admin"].role_arn, Arn)
-        assert len(restored.roles["admin"].policies) == 1
-
-        assert "web1" in restored.hosts
-        assert restored.hosts["web1"].hostname == "web1"
-
-    def test_state_json_is_valid(self) -> None:
-        state = State(namespace="test", region="us-east-1", version="1.0.0")
-        json_str = state.to_json()
+    def test_state_json_is_valid(self, empty_state: State) -> None:
+        json_str = empty_state.to_json()
 
         # Should be valid JSON
         data = json.loads(json_str)
@@ -303,6 +373,19 @@ class TestState:
         assert data["init"] is None
         assert data["cas"] == {}
 
+    def test_to_json_matches_asdict(self, fully_populated_state: State) -> None:
+        """The hand-rolled encoder must keep the persisted format byte-for-byte."""
+        expected = json.dumps(asdict(fully_populated_state), indent=2)
+        assert fully_populated_state.to_json(pretty=True) == expected
+
+    def test_to_json_compact_unless_pretty(self, empty_state: State) -> None:
+        compact = empty_state.to_json()
+        pretty = empty_state.to_json(pretty=True)
+
+        assert "\n" not in compact
+        assert pretty.startswith('{\n  "namespace"')
+        assert json.loads(compact) == json.loads(pretty)
+
 
 class TestRoleScope:
     """Tests for Role.scope field."""
@@ -310,229 +393,229 @@ class TestRoleScope:
     def test_role_default_scope(self) -> None:
         role = Role(
             stack_name="test",
-            role_arn=Arn("arn:aws:iam::123456789012:role/test"),
-            profile_arn=Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/test"),
+            role_arn=_ARN_ROLE_TEST,
+            profile_arn=_ARN_PROFILE_TEST,
         )
         assert role.scope == "default"
 
     def test_role_custom_scope(self) -> None:
         role = Role(
             stack_name="test",
-            role_arn=Arn("arn:aws:iam::123456789012:role/test"),
-            profile_arn=Arn("arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/test"),
+            role_arn=_ARN_ROLE_TEST,
+            profile_arn=_ARN_PROFILE_TEST,
             scope="cert-manager",
         )
         assert role.scope == "cert-manager"
 
-    def test_role_scope_survives_json_roundtrip(self) -> None:
-        state = State(
-            namespace="test",
-            region="us-east-1",
-            version="2.0.0",
-            init=Init(
-                stack_name="init",
-                bucket_arn=Arn("arn:aws:s3:::bucket"),
-                kms_key_arn=Arn("arn:aws:kms:us-east-1:123456789012:key/key"),
-            ),
-            roles={
-                "cert-manager": Role(
-                    stack_name="iam-ra-test-role-cert-manager",
-                    role_arn=Arn("arn:aws:iam::123456789012:role/cert-manager"),
-                    profile_arn=Arn("arn:aws:rolesanywhere:us-east-1:123456789012:profile/p-456"),
-                    scope="cert-manager",
-                ),
-            },
-        )
-        restored = State.from_json(state.to_json())
-        assert restored.roles["cert-manager"].scope == "cert-manager"
-
 
 class TestScopedCAs:
     """Tests for State.cas (scoped CA dict)."""
 
-    SAMPLE_CA = CA(
-        stack_name="iam-ra-test-ca-default",
-        mode=CAMode.SELF_SIGNED,
-        trust_anchor_arn=Arn(
-            "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-default"
-        ),
-    )
+    def test_state_empty_cas(self, empty_state: State) -> None:
+        assert empty_state.cas == {}
 
-    SAMPLE_CA_SCOPED = CA(
-        stack_name="iam-ra-test-ca-cert-manager",
-        mode=CAMode.SELF_SIGNED,
-        trust_anchor_arn=Arn(
-            "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
-        ),
-    )
-
-    def test_state_empty_cas(self) -> None:
-        state = State(namespace="test", region="us-east-1", version="2.0.0")
-        assert state.cas == {}
-
-    def test_state_with_scoped_cas(self) -> None:
-        state = State(
-            namespace="test",
-            region="us-east-1",
-            version="2.0.0",
-            cas={
-                "default": self.SAMPLE_CA,
-                "cert-manager": self.SAMPLE_CA_SCOPED,
-            },
-        )
+    def test_state_with_scoped_cas(self, scoped_cas_state: State) -> None:
+        state = scoped_cas_state
         assert len(state.cas) == 2
         assert state.cas["default"].trust_anchor_arn.resource_id == "ta-default"
         assert state.cas["cert-manager"].trust_anchor_arn.resource_id == "ta-cm"
 
-    def test_is_initialized_with_init_only(self) -> None:
+    def test_is_initialized_with_init_only(self, fully_populated_state: State) -> None:
         """is_initialized should be True when init exists (CAs are per-scope now)."""
-        state = State(
-            namespace="test",
-            region="us-east-1",
-            version="2.0.0",
-            init=Init(
-                stack_name="init",
-                bucket_arn=Arn("arn:aws:s3:::bucket"),
-                kms_key_arn=Arn("arn:aws:kms:us-east-1:123456789012:key/key"),
-            ),
-        )
+        state = replace(fully_populated_state, cas={}, roles={}, hosts={})
         assert state.is_initialized is True
 
-    def test_is_initialized_without_init(self) -> None:
-        state = State(namespace="test", region="us-east-1", version="2.0.0")
-        assert state.is_initialized is False
-
-    def test_cas_json_roundtrip(self) -> None:
-        original = State(
-            namespace="test",
-            region="us-east-1",
-            version="2.0.0",
-            init=Init(
-                stack_name="init",
-                bucket_arn=Arn("arn:aws:s3:::bucket"),
-                kms_key_arn=Arn("arn:aws:kms:us-east-1:123456789012:key/key"),
-            ),
-            cas={
-                "default": self.SAMPLE_CA,
-                "cert-manager": self.SAMPLE_CA_SCOPED,
+    def test_is_initialized_without_init(self, empty_state: State) -> None:
+        assert empty_state.is_initialized is False
+
+    def test_hosts_using_role(self, empty_state: State) -> None:
+        def host(name: str, role: str) -> Host:
+            secret = f"arn:aws:secretsmanager:us-east-1:123456789012:secret:{name}"
+            return Host(
+                stack_name=f"iam-ra-test-host-{name}",
+                hostname=name,
+                role_name=role,
+                certificate_secret_arn=Arn(secret),
+                private_key_secret_arn=Arn(secret),
+            )
+
+        state = replace(
+            empty_state,
+            hosts={
+                "web1": host("web1", "admin"),
+                "db1": host("db1", "db"),
+                "web2": host("web2", "admin"),
             },
         )
-        restored = State.from_json(original.to_json())
-
-        assert len(restored.cas) == 2
-        assert restored.cas["default"].mode == CAMode.SELF_SIGNED
-        assert isinstance(restored.cas["cert-manager"].trust_anchor_arn, Arn)
+        assert state.hosts_using_role("admin") == ("web1", "web2")
+        assert state.hosts_using_role("db") == ("db1",)
+        assert state.hosts_using_role("unused") == ()
 
-    def test_cas_json_format(self) -> None:
+    def test_cas_json_format(self, empty_state: State, sample_ca: CA) -> None:
         """Serialized JSON should use 'cas' key, not 'ca'."""
-        state = State(
-            namespace="test",
-            region="us-east-1",
-            version="2.0.0",
-            cas={"default": self.SAMPLE_CA},
-        )
+        state = replace(empty_state, cas={"default": sample_ca})
         data = json.loads(state.to_json())
         assert "cas" in data
         assert "ca" not in data
 
 
+def _check_full(restored: State, original: State) -> None:
+    assert (restored.namespace, restored.region, restored.version) == (
+        original.namespace,
+        original.region,
+        original.version,
+    )
+    assert restored.is_initialized is True
+
+    assert restored.init is not None
+    assert original.init is not None
+    assert restored.init.stack_name == original.init.stack_name
+    assert isinstance(restored.init.bucket_arn, Arn)
+
+    assert "default" in restored.cas
+    assert restored.cas["default"].mode is CAMode.SELF_SIGNED
+
+    assert "admin" in restored.roles
+    assert isinstance(restored.roles["admin"].role_arn, Arn)
+    assert len(restored.roles["admin"].policies) == 1
+
+    assert "web1" in restored.hosts
+    assert restored.hosts["web1"].hostname == "web1"
+
+
+def _check_scoped_cas(restored: State, original: State) -> None:
+    assert len(restored.cas) == 2
+    assert restored.cas["default"].mode is CAMode.SELF_SIGNED
+    assert isinstance(restored.cas["cert-manager"].trust_anchor_arn, Arn)
+
+
+def _check_role_scope(restored: State, original: State) -> None:
+    assert restored.roles["cert-manager"].scope == "cert-manager"
+
+
+@pytest.mark.parametrize(
+    "state_fixture, check",
+    [
+        pytest.param("fully_populated_state", _check_full, id="full"),
+        pytest.param("scoped_cas_state", _check_scoped_cas, id="scoped_cas"),
+        pytest.param("scoped_role_state", _check_role_scope, id="scoped_role"),
+    ],
+)
+def test_json_roundtrip(
+    request: pytest.FixtureRequest,
+    state_fixture: str,
+    check: Callable[[State, State], None],
+) -> None:
+    original: State = request.getfixturevalue(state_fixture)
+    restored = State.from_json(original.to_json())
+    check(restored, original)
+
+
+# Serialized v1/v2 state payloads for the migration tests, built once at import
+_V1_WITH_CA = json.dumps(
+    {
+        "namespace": "default",
+        "region": "us-east-1",
+        "version": "1.0.0",
+        "init": {
+            "stack_name": "iam-ra-default-init",
+            "bucket_arn": "arn:aws:s3:::test-bucket",
+            "kms_key_arn": "arn:aws:kms:us-east-1:123456789012:key/key",
+        },
+        "ca": {
+            "stack_name": "iam-ra-default-rootca",
+            "mode": "self-signed",
+            "trust_anchor_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta-123",
+        },
+        "roles": {},
+        "hosts": {},
+        "k8s_clusters": {},
+        "k8s_workloads": {},
+    }
+)
+
+_V1_WITHOUT_CA = json.dumps(
+    {
+        "namespace": "default",
+        "region": "us-east-1",
+        "version": "1.0.0",
+        "init": None,
+        "ca": None,
+        "roles": {},
+        "hosts": {},
+    }
+)
+
+_V1_ROLE_NO_SCOPE = json.dumps(
+    {
+        "namespace": "default",
+        "region": "us-east-1",
+        "version": "1.0.0",
+        "init": None,
+        "ca": None,
+        "roles": {
+            "admin": {
+                "stack_name": "iam-ra-default-role-admin",
+                "role_arn": "arn:aws:iam::123456789012:role/admin",
+                "profile_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:profile/p",
+                "policies": [],
+            }
+        },
+        "hosts": {},
+    }
+)
+
+_V2_WITH_CAS = json.dumps(
+    {
+        "namespace": "default",
+        "region": "us-east-1",
+        "version": "2.0.0",
+        "init": None,
+        "cas": {
+            "default": {
+                "stack_name": "iam-ra-default-rootca",
+                "mode": "self-signed",
+                "trust_anchor_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta",
+            },
+            "cert-manager": {
+                "stack_name": "iam-ra-default-ca-cert-manager",
+                "mode": "self-signed",
+                "trust_anchor_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta-cm",
+            },
+        },
+        "roles": {},
+        "hosts": {},
+    }
+)
+
+
 class TestV1StateMigration:
     """Tests for backward-compatible deserialization of v1 state."""
 
     def test_v1_state_with_ca_migrates_to_cas(self) -> None:
         """v1 JSON with 'ca' field should deserialize into cas['default']."""
-        v1_json = json.dumps(
-            {
-                "namespace": "default",
-                "region": "us-east-1",
-                "version": "1.0.0",
-                "init": {
-                    "stack_name": "iam-ra-default-init",
-                    "bucket_arn": "arn:aws:s3:::test-bucket",
-                    "kms_key_arn": "arn:aws:kms:us-east-1:123456789012:key/key",
-                },
-                "ca": {
-                    "stack_name": "iam-ra-default-rootca",
-                    "mode": "self-signed",
-                    "trust_anchor_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta-123",
-                },
-                "roles": {},
-                "hosts": {},
-                "k8s_clusters": {},
-                "k8s_workloads": {},
-            }
-        )
-        state = State.from_json(v1_json)
+        state = State.from_json(_V1_WITH_CA)
 
-        assert "default" in state.cas
-        assert state.cas["default"].stack_name == "iam-ra-default-rootca"
-        assert state.cas["default"].mode == CAMode.SELF_SIGNED
-        assert state.cas["default"].trust_anchor_arn.resource_id == "ta-123"
+        ca = state.cas["default"]
+        assert (ca.stack_name, ca.mode, ca.trust_anchor_arn.resource_id) == (
+            "iam-ra-default-rootca",
+            CAMode.SELF_SIGNED,
+            "ta-123",
+        )
 
     def test_v1_state_without_ca_has_empty_cas(self) -> None:
         """v1 JSON without 'ca' field should have empty cas dict."""
-        v1_json = json.dumps(
-            {
-                "namespace": "default",
-                "region": "us-east-1",
-                "version": "1.0.0",
-                "init": None,
-                "ca": None,
-                "roles": {},
-                "hosts": {},
-            }
-        )
-        state = State.from_json(v1_json)
+        state = State.from_json(_V1_WITHOUT_CA)
         assert state.cas == {}
 
     def test_v1_role_without_scope_gets_default(self) -> None:
         """v1 Role without scope field should get scope='default'."""
-        v1_json = json.dumps(
-            {
-                "namespace": "default",
-                "region": "us-east-1",
-                "version": "1.0.0",
-                "init": None,
-                "ca": None,
-                "roles": {
-                    "admin": {
-                        "stack_name": "iam-ra-default-role-admin",
-                        "role_arn": "arn:aws:iam::123456789012:role/admin",
-                        "profile_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:profile/p",
-                        "policies": [],
-                    }
-                },
-                "hosts": {},
-            }
-        )
-        state = State.from_json(v1_json)
+        state = State.from_json(_V1_ROLE_NO_SCOPE)
         assert state.roles["admin"].scope == "default"
 
     def test_v2_state_with_cas_loads_directly(self) -> None:
         """v2 JSON with 'cas' field should load without migration."""
-        v2_json = json.dumps(
-            {
-                "namespace": "default",
-                "region": "us-east-1",
-                "version": "2.0.0",
-                "init": None,
-                "cas": {
-                    "default": {
-                        "stack_name": "iam-ra-default-rootca",
-                        "mode": "self-signed",
-                        "trust_anchor_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta",
-                    },
-                    "cert-manager": {
-                        "stack_name": "iam-ra-default-ca-cert-manager",
-                        "mode": "self-signed",
-                        "trust_anchor_arn": "arn:aws:rolesanywhere:us-east-1:123456789012:trust-anchor/ta-cm",
-                    },
-                },
-                "roles": {},
-                "hosts": {},
-            }
-        )
-        state = State.from_json(v2_json)
+        state = State.from_json(_V2_WITH_CAS)
         assert len(state.cas) == 2
         assert state.cas["cert-manager"].trust_anchor_arn.resource_id == "ta-cm"
 
@@ -560,5 +643,4 @@ class TestK8sWorkloadV2:
             role_name="admin",
             namespace="cert-manager",
         )
-        assert workload.name == "my-app"
-        assert workload.namespace == "cert-manager"
+        assert (workload.name, workload.namespace) == ("my-app", "cert-manager")
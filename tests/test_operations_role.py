@@ -6,6 +6,8 @@ Tests verify:
 - stack naming is unchanged
 """
 
+from collections.abc import Iterator
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,6 +17,22 @@ from iam_ra_cli.lib.result import Ok
 from iam_ra_cli.models import Arn
 from iam_ra_cli.operations.role import _stack_name, create_role
 
+TRUST_ANCHOR_ARN = "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
+
+
+@pytest.fixture
+def aws_ctx() -> MagicMock:
+    # Function-scoped: the mock records calls, so each test gets its own
+    return MagicMock(spec=AwsContext)
+
+
+@pytest.fixture(scope="module")
+def mock_outputs() -> dict[str, str]:
+    return {
+        "RoleArn": "arn:aws:iam::123456789012:role/iam-ra-test-myrole",
+        "ProfileArn": "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-myrole",
+    }
+
 
 class TestStackName:
     """Stack naming should be unchanged by scope work."""
@@ -29,113 +47,50 @@ class TestStackName:
 class TestCreateRoleOperation:
     """Tests for create_role operation passing TrustAnchorArn to CFN."""
 
-    def test_passes_trust_anchor_arn_as_cfn_parameter(self) -> None:
-        """TrustAnchorArn must be passed as a CloudFormation parameter."""
-        trust_anchor_arn = "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-
-        mock_outputs = {
-            "RoleArn": "arn:aws:iam::123456789012:role/iam-ra-test-myrole",
-            "ProfileArn": "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-myrole",
-        }
-
-        with patch(
-            "iam_ra_cli.operations.role.deploy_stack", return_value=Ok(mock_outputs)
-        ) as mock_deploy:
-            ctx = MagicMock(spec=AwsContext)
-            result = create_role(
-                ctx,
-                "test",
-                "myrole",
-                trust_anchor_arn=trust_anchor_arn,
-            )
-
-            assert isinstance(result, Ok)
-
-            # Check deploy_stack was called with TrustAnchorArn in parameters
-            mock_deploy.assert_called_once()
-            call_kwargs = mock_deploy.call_args.kwargs
-            params = call_kwargs["parameters"]
-            assert "TrustAnchorArn" in params
-            assert params["TrustAnchorArn"] == trust_anchor_arn
-
-    def test_passes_scope_tag(self) -> None:
-        """Scope should be included as a tag on the CFN stack."""
-        trust_anchor_arn = "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-
-        mock_outputs = {
-            "RoleArn": "arn:aws:iam::123456789012:role/iam-ra-test-myrole",
-            "ProfileArn": "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-myrole",
-        }
-
-        with patch(
-            "iam_ra_cli.operations.role.deploy_stack", return_value=Ok(mock_outputs)
-        ) as mock_deploy:
-            ctx = MagicMock(spec=AwsContext)
-            result = create_role(
-                ctx,
-                "test",
-                "myrole",
-                trust_anchor_arn=trust_anchor_arn,
-                scope="cert-manager",
-            )
-
-            assert isinstance(result, Ok)
-
-            call_kwargs = mock_deploy.call_args.kwargs
-            tags = call_kwargs["tags"]
-            assert tags["iam-ra:scope"] == "cert-manager"
-
-    def test_default_scope_tag_when_not_specified(self) -> None:
-        """When scope is not explicitly given, tag should be 'default'."""
-        trust_anchor_arn = "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-
-        mock_outputs = {
-            "RoleArn": "arn:aws:iam::123456789012:role/iam-ra-test-myrole",
-            "ProfileArn": "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-myrole",
-        }
-
-        with patch(
-            "iam_ra_cli.operations.role.deploy_stack", return_value=Ok(mock_outputs)
-        ) as mock_deploy:
-            ctx = MagicMock(spec=AwsContext)
-            result = create_role(
-                ctx,
-                "test",
-                "myrole",
-                trust_anchor_arn=trust_anchor_arn,
-            )
-
-            assert isinstance(result, Ok)
-
-            call_kwargs = mock_deploy.call_args.kwargs
-            tags = call_kwargs["tags"]
-            assert tags["iam-ra:scope"] == "default"
-
-    def test_policies_forwarded_to_cfn(self) -> None:
-        """PolicyArns should still be passed through when provided."""
-        trust_anchor_arn = "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-123"
-        policies = ["arn:aws:iam::aws:policy/ReadOnlyAccess"]
-
-        mock_outputs = {
-            "RoleArn": "arn:aws:iam::123456789012:role/iam-ra-test-myrole",
-            "ProfileArn": "arn:aws:rolesanywhere:ap-southeast-2:123456789012:profile/p-myrole",
-        }
-
+    @pytest.fixture
+    def mock_deploy(self, mock_outputs: dict[str, str]) -> Iterator[MagicMock]:
         with patch(
             "iam_ra_cli.operations.role.deploy_stack", return_value=Ok(mock_outputs)
         ) as mock_deploy:
-            ctx = MagicMock(spec=AwsContext)
-            result = create_role(
-                ctx,
-                "test",
-                "myrole",
-                policies=policies,
-                trust_anchor_arn=trust_anchor_arn,
-            )
-
-            assert isinstance(result, Ok)
-
-            call_kwargs = mock_deploy.call_args.kwargs
-            params = call_kwargs["parameters"]
-            assert params["PolicyArns"] == "arn:aws:iam::aws:policy/ReadOnlyAccess"
-            assert params["TrustAnchorArn"] == trust_anchor_arn
+            yield mock_deploy
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_params, expected_tags",
+        [
+            # TrustAnchorArn must be passed as a CloudFormation parameter
+            pytest.param({}, {"TrustAnchorArn": TRUST_ANCHOR_ARN}, {}, id="trust_anchor_param"),
+            # Scope should be included as a tag on the CFN stack
+            pytest.param(
+                {"scope": "cert-manager"}, {}, {"iam-ra:scope": "cert-manager"}, id="scope_tag"
+            ),
+            # When scope is not explicitly given, tag should be 'default'
+            pytest.param({}, {}, {"iam-ra:scope": "default"}, id="default_scope_tag"),
+            # PolicyArns should still be passed through when provided
+            pytest.param(
+                {"policies": ["arn:aws:iam::aws:policy/ReadOnlyAccess"]},
+                {
+                    "PolicyArns": "arn:aws:iam::aws:policy/ReadOnlyAccess",
+                    "TrustAnchorArn": TRUST_ANCHOR_ARN,
+                },
+                {},
+                id="policies_forwarded",
+            ),
+        ],
+    )
+    def test_create_role_forwards_to_cfn(
+        self,
+        aws_ctx: MagicMock,
+        mock_deploy: MagicMock,
+        kwargs: dict[str, Any],
+        expected_params: dict[str, str],
+        expected_tags: dict[str, str],
+    ) -> None:
+        result = create_role(aws_ctx, "test", "myrole", trust_anchor_arn=TRUST_ANCHOR_ARN, **kwargs)
+
+        assert isinstance(result, Ok)
+        mock_deploy.assert_called_once()
+        call_kwargs = mock_deploy.call_args.kwargs
+        params = call_kwargs["parameters"]
+        tags = call_kwargs["tags"]
+        assert {k: params.get(k) for k in expected_params} == expected_params
+        assert {k: tags.get(k) for k in expected_tags} == expected_tags
@@ -43,6 +43,17 @@ class TestOkErr:
         result = Ok(None)
         assert result.value is None
 
+    @pytest.mark.parametrize("value", [None, True, False])
+    def test_ok_function_shares_constant_results(self, value: bool | None) -> None:
+        result = ok(value)
+        assert result == Ok(value)
+        assert result.value is value
+        assert ok(value) is result
+
+    def test_ok_function_does_not_share_equal_ints(self) -> None:
+        assert ok(1).value is not True
+        assert ok(0).value is not False
+
     def test_ok_with_complex_type(self) -> None:
         data = {"key": [1, 2, 3]}
         result = Ok(data)
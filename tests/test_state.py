@@ -1,13 +1,17 @@
 """Tests for lib/state.py - State management with SSM and S3."""
 
 import json
+import os
 import tempfile
+import time
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
-from moto import mock_aws
 
 from iam_ra_cli.lib import state as state_module
+from iam_ra_cli.lib.errors import NotInitializedError
 from iam_ra_cli.lib.result import Err, Ok
 from iam_ra_cli.models import CA, Arn, CAMode, Host, Init, Role, State
 
@@ -37,21 +41,20 @@ def temp_cache_dir(monkeypatch: pytest.MonkeyPatch):
 
 
 @pytest.fixture
-def aws_clients(aws_credentials: None, temp_cache_dir: Path):
+def aws_clients(aws_credentials: None, temp_cache_dir: Path, moto_backends):
     """Create mocked SSM and S3 clients."""
     import boto3
 
-    with mock_aws():
-        ssm = boto3.client("ssm", region_name="ap-southeast-2")
-        s3 = boto3.client("s3", region_name="ap-southeast-2")
+    ssm = boto3.client("ssm", region_name="ap-southeast-2")
+    s3 = boto3.client("s3", region_name="ap-southeast-2")
 
-        # Create test bucket
-        s3.create_bucket(
-            Bucket="test-bucket",
-            CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
-        )
+    # Create test bucket
+    s3.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
 
-        yield ssm, s3
+    return ssm, s3
 
 
 @pytest.fixture
@@ -207,6 +210,38 @@ class TestStateSave:
         assert stored_state.namespace == sample_state.namespace
         assert stored_state.is_initialized is True
 
+    def test_repeat_save_skips_known_ssm_pointer(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+
+        state_module.save(ssm, s3, sample_state)
+        state_module.save(ssm, s3, sample_state)
+
+        # The pointer never changes, so it is only written once
+        param = ssm.get_parameter(Name=f"/iam-ra/{sample_state.namespace}/state-location")
+        assert param["Parameter"]["Version"] == 1
+
+    def test_unchanged_save_skips_s3(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+
+        s3.put_object = MagicMock(wraps=s3.put_object)
+        assert state_module.save(ssm, s3, sample_state) == Ok(None)
+        s3.put_object.assert_not_called()
+
+        changed = replace(sample_state, version="0.2.0")
+        assert state_module.save(ssm, s3, changed) == Ok(None)
+        s3.put_object.assert_called_once()
+
+    def test_save_after_load_of_same_state_skips_s3(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+        state_module.invalidate_cache(sample_state.namespace)
+        loaded = state_module.load(ssm, s3, sample_state.namespace)
+
+        s3.put_object = MagicMock(wraps=s3.put_object)
+        assert state_module.save(ssm, s3, loaded.value) == Ok(None)
+        s3.put_object.assert_not_called()
+
     def test_save_without_init_fails(self, aws_clients) -> None:
         ssm, s3 = aws_clients
 
@@ -221,6 +256,22 @@ class TestStateSave:
 class TestStateCache:
     """Tests for state caching."""
 
+    def test_cache_file_matches_s3_body(
+        self, aws_clients, temp_cache_dir: Path, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+
+        state_module.save(ssm, s3, sample_state)
+        saved = (temp_cache_dir / namespace / "state.json").read_bytes()
+        response = s3.get_object(Bucket="test-bucket", Key=f"{namespace}/state.json")
+        assert saved == response["Body"].read()
+
+        # A load from S3 rewrites the cache with the body it fetched
+        state_module.invalidate_cache(namespace)
+        assert isinstance(state_module.load(ssm, s3, namespace), Ok)
+        assert (temp_cache_dir / namespace / "state.json").read_bytes() == saved
+
     def test_invalidate_cache(self, aws_clients, temp_cache_dir: Path, sample_state: State) -> None:
         ssm, s3 = aws_clients
         namespace = sample_state.namespace
@@ -237,3 +288,279 @@ class TestStateCache:
 
         # Verify cache is gone
         assert not cache_path.exists()
+
+
+class TestStateMemo:
+    """Tests for in-process state memoization."""
+
+    def test_load_after_save_skips_aws(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+
+        # Remove the backing object: a memo hit must not touch S3
+        s3.delete_object(Bucket="test-bucket", Key=f"{sample_state.namespace}/state.json")
+
+        result = state_module.load(ssm, s3, sample_state.namespace)
+
+        assert isinstance(result, Ok)
+        assert result.value is not None
+        assert result.value.namespace == sample_state.namespace
+
+    def test_load_returns_fresh_state_objects(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+
+        first = state_module.load(ssm, s3, sample_state.namespace)
+        second = state_module.load(ssm, s3, sample_state.namespace)
+
+        assert isinstance(first, Ok) and isinstance(second, Ok)
+        assert first.value is not second.value
+        assert first.value == second.value
+
+    def test_skip_cache_bypasses_memo(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+        s3.delete_object(Bucket="test-bucket", Key=f"{sample_state.namespace}/state.json")
+
+        result = state_module.load(ssm, s3, sample_state.namespace, skip_cache=True)
+
+        assert isinstance(result, Err)
+
+    def test_invalidate_cache_clears_memo(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+        s3.delete_object(Bucket="test-bucket", Key=f"{sample_state.namespace}/state.json")
+
+        state_module.invalidate_cache(sample_state.namespace)
+        result = state_module.load(ssm, s3, sample_state.namespace)
+
+        assert isinstance(result, Err)
+
+    def test_memo_expires_after_cache_ttl(
+        self,
+        aws_clients,
+        temp_cache_dir: Path,
+        sample_state: State,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+        state_module.save(ssm, s3, sample_state)
+
+        # Another writer updates S3 behind this process's back
+        changed = replace(sample_state, version="0.2.0")
+        s3.put_object(
+            Bucket="test-bucket", Key=f"{namespace}/state.json", Body=changed.to_json().encode()
+        )
+        assert state_module.load(ssm, s3, namespace) == Ok(sample_state)
+
+        # Past the TTL, both the memo and the cache file are stale
+        cache_path = temp_cache_dir / namespace / "state.json"
+        old = time.time() - state_module.CACHE_TTL - 1
+        os.utime(cache_path, (old, old))
+        now = time.monotonic()
+        monkeypatch.setattr(
+            state_module.time, "monotonic", lambda: now + state_module.CACHE_TTL + 1
+        )
+
+        assert state_module.load(ssm, s3, namespace) == Ok(changed)
+
+    def test_uninitialized_answer_is_cached(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        assert state_module.load(ssm, s3, "test", cache_uninitialized=True) == Ok(None)
+
+        # Pointer created behind our back: still within the TTL, so not seen
+        ssm.put_parameter(
+            Name="/iam-ra/test/state-location",
+            Value="s3://test-bucket/test/state.json",
+            Type="String",
+        )
+        assert state_module.load(ssm, s3, "test", cache_uninitialized=True) == Ok(None)
+
+        # A save through this module clears the negative entry
+        state_module.save(ssm, s3, sample_state)
+        result = state_module.load(ssm, s3, "test", cache_uninitialized=True)
+        assert isinstance(result, Ok)
+        assert result.value is not None
+
+    def test_uninitialized_answer_is_not_cached_by_default(
+        self, aws_clients, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        assert state_module.load(ssm, s3, "test", cache_uninitialized=True) == Ok(None)
+
+        # Another process runs init: a plain load sees it at once
+        s3.put_object(
+            Bucket="test-bucket", Key="test/state.json", Body=sample_state.to_json().encode()
+        )
+        ssm.put_parameter(
+            Name="/iam-ra/test/state-location",
+            Value="s3://test-bucket/test/state.json",
+            Type="String",
+        )
+        assert state_module.load(ssm, s3, "test") == Ok(sample_state)
+
+
+class TestStatePrefetch:
+    """Tests for fetching state from S3 while SSM confirms its location."""
+
+    @staticmethod
+    def _stale_cache(cache_path: Path, data: str) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(data)
+        old = time.time() - state_module.CACHE_TTL - 60
+        os.utime(cache_path, (old, old))
+
+    def test_stale_cache_location_is_prefetched(
+        self, aws_clients, temp_cache_dir: Path, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+        state_module.save(ssm, s3, sample_state)
+        state_module.invalidate_cache(namespace)
+        self._stale_cache(temp_cache_dir / namespace / "state.json", sample_state.to_json())
+
+        s3.get_object = MagicMock(wraps=s3.get_object)
+        result = state_module.load(ssm, s3, namespace)
+
+        assert result == Ok(sample_state)
+        # SSM agreed with the guess, so the prefetched object was used
+        s3.get_object.assert_called_once_with(Bucket="test-bucket", Key=f"{namespace}/state.json")
+
+    def test_wrong_guess_falls_back_to_ssm_location(
+        self, aws_clients, temp_cache_dir: Path, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+        state_module.save(ssm, s3, sample_state)
+        state_module.invalidate_cache(namespace)
+        moved = replace(
+            sample_state,
+            init=replace(sample_state.init, bucket_arn=Arn("arn:aws:s3:::other-bucket")),
+        )
+        self._stale_cache(temp_cache_dir / namespace / "state.json", moved.to_json())
+
+        s3.get_object = MagicMock(wraps=s3.get_object)
+        result = state_module.load(ssm, s3, namespace)
+
+        assert result == Ok(sample_state)
+        assert s3.get_object.call_count == 2
+        s3.get_object.assert_called_with(Bucket="test-bucket", Key=f"{namespace}/state.json")
+
+
+class TestStateRevalidation:
+    """Tests for revalidating a stale cache with a conditional GET."""
+
+    @staticmethod
+    def _age(cache_path: Path) -> None:
+        old = time.time() - state_module.CACHE_TTL - 60
+        os.utime(cache_path, (old, old))
+
+    def test_unchanged_state_is_not_downloaded(
+        self, aws_clients, temp_cache_dir: Path, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+        state_module.save(ssm, s3, sample_state)
+        cache_path = temp_cache_dir / namespace / "state.json"
+        etag = (temp_cache_dir / namespace / "state.json.etag").read_text().split("\n")[0]
+        state_module._memo.clear()
+        self._age(cache_path)
+
+        s3.get_object = MagicMock(wraps=s3.get_object)
+        result = state_module.load(ssm, s3, namespace)
+
+        assert result == Ok(sample_state)
+        s3.get_object.assert_called_once_with(
+            Bucket="test-bucket", Key=f"{namespace}/state.json", IfNoneMatch=etag
+        )
+        # The 304 makes the cache fresh again
+        assert state_module.file.is_fresh(cache_path, state_module.CACHE_TTL)
+
+    def test_changed_state_is_downloaded(
+        self, aws_clients, temp_cache_dir: Path, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+        state_module.save(ssm, s3, sample_state)
+        cache_path = temp_cache_dir / namespace / "state.json"
+        etag_path = temp_cache_dir / namespace / "state.json.etag"
+        old_etag = etag_path.read_text().split("\n")[0]
+        changed = replace(sample_state, version="0.2.0")
+        response = s3.put_object(
+            Bucket="test-bucket", Key=f"{namespace}/state.json", Body=changed.to_json().encode()
+        )
+        state_module._memo.clear()
+        self._age(cache_path)
+
+        result = state_module.load(ssm, s3, namespace)
+
+        assert result == Ok(changed)
+        assert etag_path.read_text().split("\n")[0] == response["ETag"] != old_etag
+        assert State.from_json(cache_path.read_text()) == changed
+
+    def test_etag_of_another_body_is_ignored(
+        self, aws_clients, temp_cache_dir: Path, sample_state: State
+    ) -> None:
+        ssm, s3 = aws_clients
+        namespace = sample_state.namespace
+        state_module.save(ssm, s3, sample_state)
+        state_module._memo.clear()
+
+        # A body from another writer, next to the ETag of the saved one
+        cache_path = temp_cache_dir / namespace / "state.json"
+        cache_path.write_text(replace(sample_state, version="0.0.1").to_json(pretty=True))
+        self._age(cache_path)
+
+        s3.get_object = MagicMock(wraps=s3.get_object)
+        result = state_module.load(ssm, s3, namespace)
+
+        assert result == Ok(sample_state)
+        assert "IfNoneMatch" not in s3.get_object.call_args.kwargs
+
+    def test_skip_cache_ignores_etag(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+
+        s3.get_object = MagicMock(wraps=s3.get_object)
+        result = state_module.load(ssm, s3, sample_state.namespace, skip_cache=True)
+
+        assert result == Ok(sample_state)
+        assert "IfNoneMatch" not in s3.get_object.call_args.kwargs
+
+
+class TestLoadInitialized:
+    """Tests for load_initialized helper."""
+
+    def test_uninitialized_namespace_is_error(self, aws_clients) -> None:
+        ssm, s3 = aws_clients
+
+        result = state_module.load_initialized(ssm, s3, "nonexistent", skip_cache=True)
+
+        assert isinstance(result, Err)
+        assert isinstance(result.error, NotInitializedError)
+        assert result.error.namespace == "nonexistent"
+
+    def test_state_without_init_is_error(self, aws_clients) -> None:
+        ssm, s3 = aws_clients
+        bare = State(namespace="test", region="ap-southeast-2", version="0.1.0")
+        s3.put_object(Bucket="test-bucket", Key="test/state.json", Body=bare.to_json().encode())
+        ssm.put_parameter(
+            Name="/iam-ra/test/state-location",
+            Value="s3://test-bucket/test/state.json",
+            Type="String",
+        )
+
+        result = state_module.load_initialized(ssm, s3, "test", skip_cache=True)
+
+        assert isinstance(result, Err)
+        assert isinstance(result.error, NotInitializedError)
+
+    def test_initialized_state_is_returned(self, aws_clients, sample_state: State) -> None:
+        ssm, s3 = aws_clients
+        state_module.save(ssm, s3, sample_state)
+
+        result = state_module.load_initialized(ssm, s3, sample_state.namespace)
+
+        assert isinstance(result, Ok)
+        assert result.value.is_initialized is True
@@ -1,10 +1,17 @@
 """Tests for lib/storage/s3.py - S3 storage operations with moto."""
 
 import pytest
-from moto import mock_aws
 
 from iam_ra_cli.lib.result import Err, Ok
-from iam_ra_cli.lib.storage.s3 import delete_object, object_exists, read_object, write_object
+from iam_ra_cli.lib.storage.s3 import (
+    PEM_CONTENT_TYPE,
+    copy_object,
+    delete_object,
+    delete_objects,
+    object_exists,
+    read_object,
+    write_object,
+)
 
 
 @pytest.fixture
@@ -18,13 +25,11 @@ def aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.fixture
-def s3_client(aws_credentials: None):
+def s3_client(aws_credentials: None, moto_backends):
     """Create mocked S3 client."""
     import boto3
 
-    with mock_aws():
-        client = boto3.client("s3", region_name="ap-southeast-2")
-        yield client
+    return boto3.client("s3", region_name="ap-southeast-2")
 
 
 @pytest.fixture
@@ -99,6 +104,15 @@ class TestWriteObject:
         response = s3.get_object(Bucket=bucket, Key=key)
         assert response["Body"].read().decode("utf-8") == new_content
 
+    def test_write_with_content_type(self, bucket_with_object) -> None:
+        s3, bucket, _, _ = bucket_with_object
+
+        result = write_object(s3, bucket, "cert.pem", "PEM", content_type=PEM_CONTENT_TYPE)
+
+        assert isinstance(result, Ok)
+        response = s3.head_object(Bucket=bucket, Key="cert.pem")
+        assert response["ContentType"] == PEM_CONTENT_TYPE
+
     def test_write_to_nonexistent_bucket(self, s3_client) -> None:
         result = write_object(s3_client, "nonexistent-bucket", "any-key", "content")
 
@@ -118,6 +132,41 @@ class TestWriteObject:
         response = s3.get_object(Bucket=bucket, Key=key)
         assert response["Body"].read().decode("utf-8") == content
 
+    def test_write_bytes_as_is(self, bucket_with_object) -> None:
+        s3, bucket, _, _ = bucket_with_object
+        content = "Grüße".encode()
+
+        result = write_object(s3, bucket, "raw.bin", content)
+
+        assert isinstance(result, Ok)
+        response = s3.get_object(Bucket=bucket, Key="raw.bin")
+        assert response["Body"].read() == content
+
+
+class TestCopyObject:
+    """Tests for copy_object function."""
+
+    def test_copy_existing_object(self, bucket_with_object) -> None:
+        s3, bucket, key, content = bucket_with_object
+
+        result = copy_object(s3, bucket, key, "copied-key.txt")
+
+        assert isinstance(result, Ok)
+
+        # Verify the copy and that the source is untouched
+        response = s3.get_object(Bucket=bucket, Key="copied-key.txt")
+        assert response["Body"].read().decode("utf-8") == content
+        assert object_exists(s3, bucket, key) is True
+
+    def test_copy_nonexistent_object(self, bucket_with_object) -> None:
+        s3, bucket, _, _ = bucket_with_object
+
+        result = copy_object(s3, bucket, "nonexistent-key", "copied-key.txt")
+
+        assert isinstance(result, Err)
+        assert result.error.bucket == bucket
+        assert result.error.key == "copied-key.txt"
+
 
 class TestDeleteObject:
     """Tests for delete_object function."""
@@ -142,6 +191,34 @@ class TestDeleteObject:
         assert isinstance(result, Ok)
 
 
+class TestDeleteObjects:
+    """Tests for delete_objects function."""
+
+    def test_delete_many_objects(self, bucket_with_object) -> None:
+        s3, bucket, key, _ = bucket_with_object
+        s3.put_object(Bucket=bucket, Key="other-key.txt", Body=b"other")
+
+        result = delete_objects(s3, bucket, [key, "other-key.txt"])
+
+        assert isinstance(result, Ok)
+        assert object_exists(s3, bucket, key) is False
+        assert object_exists(s3, bucket, "other-key.txt") is False
+
+    def test_delete_no_keys_is_noop(self, bucket_with_object) -> None:
+        s3, bucket, key, _ = bucket_with_object
+
+        result = delete_objects(s3, bucket, [])
+
+        assert isinstance(result, Ok)
+        assert object_exists(s3, bucket, key) is True
+
+    def test_delete_from_nonexistent_bucket(self, s3_client) -> None:
+        result = delete_objects(s3_client, "nonexistent-bucket", ["any-key"])
+
+        assert isinstance(result, Err)
+        assert result.error.bucket == "nonexistent-bucket"
+
+
 class TestObjectExists:
     """Tests for object_exists function."""
 
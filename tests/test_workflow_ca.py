@@ -10,7 +10,6 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from moto import mock_aws
 
 from iam_ra_cli.lib.aws import AwsContext
 from iam_ra_cli.lib.errors import (
@@ -50,6 +49,12 @@ def temp_xdg_dirs(monkeypatch: pytest.MonkeyPatch):
         yield base
 
 
+@pytest.fixture
+def ctx(aws_credentials, temp_xdg_dirs, moto_backends) -> AwsContext:
+    """AwsContext on the module's shared moto mock, reset for each test."""
+    return AwsContext(region="ap-southeast-2")
+
+
 @pytest.fixture
 def initialized_state() -> State:
     """Create an initialized state with default CA."""
@@ -114,133 +119,115 @@ def setup_state_in_aws(ctx: AwsContext, state: State) -> None:
 class TestSetupCA:
     """Tests for setup_ca workflow."""
 
-    def test_fails_when_not_initialized(self, aws_credentials, temp_xdg_dirs) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            result = setup_ca(ctx, "test", scope="cert-manager")
-            assert isinstance(result, Err)
-            assert isinstance(result.error, NotInitializedError)
+    def test_fails_when_not_initialized(self, ctx: AwsContext) -> None:
+        result = setup_ca(ctx, "test", scope="cert-manager")
+        assert isinstance(result, Err)
+        assert isinstance(result.error, NotInitializedError)
 
     def test_fails_when_scope_already_exists(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
+        self, ctx: AwsContext, initialized_state: State
     ) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
-
-            result = setup_ca(ctx, "test", scope="default")
-            assert isinstance(result, Err)
-            assert isinstance(result.error, CAScopeAlreadyExistsError)
-            assert result.error.scope == "default"
+        setup_state_in_aws(ctx, initialized_state)
 
-    def test_creates_new_scope(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
-    ) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
+        result = setup_ca(ctx, "test", scope="default")
+        assert isinstance(result, Err)
+        assert isinstance(result.error, CAScopeAlreadyExistsError)
+        assert result.error.scope == "default"
 
-            mock_ca_result = SelfSignedCAResult(
-                stack_name="iam-ra-test-ca-cert-manager",
-                trust_anchor_arn=Arn(
-                    "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
-                ),
-                cert_s3_key="test/scopes/cert-manager/ca/certificate.pem",
-                local_key_path=Path("/tmp/fake"),
-            )
+    def test_creates_new_scope(self, ctx: AwsContext, initialized_state: State) -> None:
+        setup_state_in_aws(ctx, initialized_state)
 
-            with patch(
-                "iam_ra_cli.workflows.ca.create_self_signed_ca",
-                return_value=Ok(mock_ca_result),
-            ):
-                result = setup_ca(ctx, "test", scope="cert-manager")
+        mock_ca_result = SelfSignedCAResult(
+            stack_name="iam-ra-test-ca-cert-manager",
+            trust_anchor_arn=Arn(
+                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
+            ),
+            cert_s3_key="test/scopes/cert-manager/ca/certificate.pem",
+            local_key_path=Path("/tmp/fake"),
+        )
+
+        with patch(
+            "iam_ra_cli.workflows.ca.create_self_signed_ca",
+            return_value=Ok(mock_ca_result),
+        ):
+            result = setup_ca(ctx, "test", scope="cert-manager")
 
-            assert isinstance(result, Ok)
-            assert result.value.mode == CAMode.SELF_SIGNED
-            assert result.value.stack_name == "iam-ra-test-ca-cert-manager"
+        assert isinstance(result, Ok)
+        assert result.value.mode == CAMode.SELF_SIGNED
+        assert result.value.stack_name == "iam-ra-test-ca-cert-manager"
 
     def test_creates_first_scope_on_init_without_ca(
-        self, aws_credentials, temp_xdg_dirs, initialized_state_no_ca: State
+        self, ctx: AwsContext, initialized_state_no_ca: State
     ) -> None:
         """Should work even when state has init but no CAs yet."""
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state_no_ca)
-
-            mock_ca_result = SelfSignedCAResult(
-                stack_name="iam-ra-test-ca-default",
-                trust_anchor_arn=Arn(
-                    "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-d"
-                ),
-                cert_s3_key="test/scopes/default/ca/certificate.pem",
-                local_key_path=Path("/tmp/fake"),
-            )
+        setup_state_in_aws(ctx, initialized_state_no_ca)
 
-            with patch(
-                "iam_ra_cli.workflows.ca.create_self_signed_ca",
-                return_value=Ok(mock_ca_result),
-            ):
-                result = setup_ca(ctx, "test", scope="default")
+        mock_ca_result = SelfSignedCAResult(
+            stack_name="iam-ra-test-ca-default",
+            trust_anchor_arn=Arn(
+                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-d"
+            ),
+            cert_s3_key="test/scopes/default/ca/certificate.pem",
+            local_key_path=Path("/tmp/fake"),
+        )
+
+        with patch(
+            "iam_ra_cli.workflows.ca.create_self_signed_ca",
+            return_value=Ok(mock_ca_result),
+        ):
+            result = setup_ca(ctx, "test", scope="default")
 
-            assert isinstance(result, Ok)
-            assert result.value.trust_anchor_arn.resource_id == "ta-d"
+        assert isinstance(result, Ok)
+        assert result.value.trust_anchor_arn.resource_id == "ta-d"
 
-    def test_passes_scope_to_operation(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
-    ) -> None:
+    def test_passes_scope_to_operation(self, ctx: AwsContext, initialized_state: State) -> None:
         """Should pass scope parameter to the CA operation."""
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
+        setup_state_in_aws(ctx, initialized_state)
 
-            mock_ca_result = SelfSignedCAResult(
-                stack_name="iam-ra-test-ca-longhorn-system",
-                trust_anchor_arn=Arn(
-                    "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-ls"
-                ),
-                cert_s3_key="test/scopes/longhorn-system/ca/certificate.pem",
-                local_key_path=Path("/tmp/fake"),
-            )
-
-            with patch(
-                "iam_ra_cli.workflows.ca.create_self_signed_ca",
-                return_value=Ok(mock_ca_result),
-            ) as mock_create:
-                setup_ca(ctx, "test", scope="longhorn-system", validity_years=5)
-
-            mock_create.assert_called_once()
-            call_kwargs = mock_create.call_args
-            assert call_kwargs.kwargs.get("scope") == "longhorn-system"
-            assert call_kwargs.kwargs.get("validity_years") == 5
-
-    def test_saves_state_after_creation(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
-    ) -> None:
+        mock_ca_result = SelfSignedCAResult(
+            stack_name="iam-ra-test-ca-longhorn-system",
+            trust_anchor_arn=Arn(
+                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-ls"
+            ),
+            cert_s3_key="test/scopes/longhorn-system/ca/certificate.pem",
+            local_key_path=Path("/tmp/fake"),
+        )
+
+        with patch(
+            "iam_ra_cli.workflows.ca.create_self_signed_ca",
+            return_value=Ok(mock_ca_result),
+        ) as mock_create:
+            setup_ca(ctx, "test", scope="longhorn-system", validity_years=5)
+
+        mock_create.assert_called_once()
+        call_kwargs = mock_create.call_args
+        assert call_kwargs.kwargs.get("scope") == "longhorn-system"
+        assert call_kwargs.kwargs.get("validity_years") == 5
+
+    def test_saves_state_after_creation(self, ctx: AwsContext, initialized_state: State) -> None:
         """Should persist the new CA to state."""
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
+        setup_state_in_aws(ctx, initialized_state)
 
-            mock_ca_result = SelfSignedCAResult(
-                stack_name="iam-ra-test-ca-cert-manager",
-                trust_anchor_arn=Arn(
-                    "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
-                ),
-                cert_s3_key="test/scopes/cert-manager/ca/certificate.pem",
-                local_key_path=Path("/tmp/fake"),
-            )
+        mock_ca_result = SelfSignedCAResult(
+            stack_name="iam-ra-test-ca-cert-manager",
+            trust_anchor_arn=Arn(
+                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
+            ),
+            cert_s3_key="test/scopes/cert-manager/ca/certificate.pem",
+            local_key_path=Path("/tmp/fake"),
+        )
 
-            with patch(
-                "iam_ra_cli.workflows.ca.create_self_signed_ca",
-                return_value=Ok(mock_ca_result),
-            ):
-                setup_ca(ctx, "test", scope="cert-manager")
+        with patch(
+            "iam_ra_cli.workflows.ca.create_self_signed_ca",
+            return_value=Ok(mock_ca_result),
+        ):
+            setup_ca(ctx, "test", scope="cert-manager")
 
-            # Verify by listing
-            result = list_cas(ctx, "test")
-            assert isinstance(result, Ok)
-            assert "cert-manager" in result.value
-            assert "default" in result.value
+        # Verify by listing
+        result = list_cas(ctx, "test")
+        assert isinstance(result, Ok)
+        assert "cert-manager" in result.value
+        assert "default" in result.value
 
 
 # =============================================================================
@@ -251,49 +238,37 @@ class TestSetupCA:
 class TestDeleteScope:
     """Tests for delete_scope workflow."""
 
-    def test_fails_when_not_initialized(self, aws_credentials, temp_xdg_dirs) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            result = delete_scope(ctx, "test", "default")
-            assert isinstance(result, Err)
-            assert isinstance(result.error, NotInitializedError)
+    def test_fails_when_not_initialized(self, ctx: AwsContext) -> None:
+        result = delete_scope(ctx, "test", "default")
+        assert isinstance(result, Err)
+        assert isinstance(result.error, NotInitializedError)
 
-    def test_fails_when_scope_not_found(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
-    ) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
+    def test_fails_when_scope_not_found(self, ctx: AwsContext, initialized_state: State) -> None:
+        setup_state_in_aws(ctx, initialized_state)
 
-            result = delete_scope(ctx, "test", "nonexistent")
-            assert isinstance(result, Err)
-            assert isinstance(result.error, CAScopeNotFoundError)
-            assert result.error.scope == "nonexistent"
+        result = delete_scope(ctx, "test", "nonexistent")
+        assert isinstance(result, Err)
+        assert isinstance(result.error, CAScopeNotFoundError)
+        assert result.error.scope == "nonexistent"
 
-    def test_deletes_scope(self, aws_credentials, temp_xdg_dirs, initialized_state: State) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
+    def test_deletes_scope(self, ctx: AwsContext, initialized_state: State) -> None:
+        setup_state_in_aws(ctx, initialized_state)
 
-            with patch("iam_ra_cli.workflows.ca.delete_ca_op", return_value=Ok(None)):
-                result = delete_scope(ctx, "test", "default")
+        with patch("iam_ra_cli.workflows.ca.delete_ca_op", return_value=Ok(None)):
+            result = delete_scope(ctx, "test", "default")
 
-            assert isinstance(result, Ok)
+        assert isinstance(result, Ok)
 
-    def test_removes_scope_from_state(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
-    ) -> None:
+    def test_removes_scope_from_state(self, ctx: AwsContext, initialized_state: State) -> None:
         """Deleting a scope should remove it from state."""
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state)
+        setup_state_in_aws(ctx, initialized_state)
 
-            with patch("iam_ra_cli.workflows.ca.delete_ca_op", return_value=Ok(None)):
-                delete_scope(ctx, "test", "default")
+        with patch("iam_ra_cli.workflows.ca.delete_ca_op", return_value=Ok(None)):
+            delete_scope(ctx, "test", "default")
 
-            result = list_cas(ctx, "test")
-            assert isinstance(result, Ok)
-            assert "default" not in result.value
+        result = list_cas(ctx, "test")
+        assert isinstance(result, Ok)
+        assert "default" not in result.value
 
 
 # =============================================================================
@@ -304,41 +279,31 @@ class TestDeleteScope:
 class TestListCAs:
     """Tests for list_cas workflow."""
 
-    def test_fails_when_not_initialized(self, aws_credentials, temp_xdg_dirs) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            result = list_cas(ctx, "test")
-            assert isinstance(result, Err)
-            assert isinstance(result.error, NotInitializedError)
-
-    def test_lists_empty(
-        self, aws_credentials, temp_xdg_dirs, initialized_state_no_ca: State
-    ) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            setup_state_in_aws(ctx, initialized_state_no_ca)
-
-            result = list_cas(ctx, "test")
-            assert isinstance(result, Ok)
-            assert result.value == {}
-
-    def test_lists_all_scopes(
-        self, aws_credentials, temp_xdg_dirs, initialized_state: State
-    ) -> None:
-        with mock_aws():
-            ctx = AwsContext(region="ap-southeast-2")
-            # Add a second scope
-            initialized_state.cas["cert-manager"] = CA(
-                stack_name="iam-ra-test-ca-cert-manager",
-                mode=CAMode.SELF_SIGNED,
-                trust_anchor_arn=Arn(
-                    "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
-                ),
-            )
-            setup_state_in_aws(ctx, initialized_state)
-
-            result = list_cas(ctx, "test")
-            assert isinstance(result, Ok)
-            assert len(result.value) == 2
-            assert "default" in result.value
-            assert "cert-manager" in result.value
+    def test_fails_when_not_initialized(self, ctx: AwsContext) -> None:
+        result = list_cas(ctx, "test")
+        assert isinstance(result, Err)
+        assert isinstance(result.error, NotInitializedError)
+
+    def test_lists_empty(self, ctx: AwsContext, initialized_state_no_ca: State) -> None:
+        setup_state_in_aws(ctx, initialized_state_no_ca)
+
+        result = list_cas(ctx, "test")
+        assert isinstance(result, Ok)
+        assert result.value == {}
+
+    def test_lists_all_scopes(self, ctx: AwsContext, initialized_state: State) -> None:
+        # Add a second scope
+        initialized_state.cas["cert-manager"] = CA(
+            stack_name="iam-ra-test-ca-cert-manager",
+            mode=CAMode.SELF_SIGNED,
+            trust_anchor_arn=Arn(
+                "arn:aws:rolesanywhere:ap-southeast-2:123456789012:trust-anchor/ta-cm"
+            ),
+        )
+        setup_state_in_aws(ctx, initialized_state)
+
+        result = list_cas(ctx, "test")
+        assert isinstance(result, Ok)
+        assert len(result.value) == 2
+        assert "default" in result.value
+        assert "cert-manager" in result.value
@@ -343,6 +343,45 @@ class TestMigrateS3Paths:
             assert isinstance(result, Ok)
             assert not result.value.s3_migrated
 
+    def test_existing_scoped_cert_is_not_overwritten(self, aws_credentials, temp_xdg_dirs) -> None:
+        """If the scoped cert already exists, the old cert must not be copied over it."""
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=False)
+            setup_v1_local_key(temp_xdg_dirs / "data")
+
+            # Scoped cert already in place; old cert still present
+            ctx.s3.put_object(
+                Bucket="test-bucket",
+                Key="test/scopes/default/ca/certificate.pem",
+                Body=b"scoped",
+            )
+
+            with (
+                patch(
+                    "iam_ra_cli.workflows.migrate.update_role_stack",
+                    return_value=Ok(None),
+                ),
+                patch(
+                    "iam_ra_cli.workflows.migrate.migrate_ca_stack",
+                    return_value=Ok(MIGRATED_TA_ARN),
+                ),
+            ):
+                result = migrate(ctx, "test")
+
+            assert isinstance(result, Ok)
+            assert not result.value.s3_migrated
+            obj = ctx.s3.get_object(
+                Bucket="test-bucket", Key="test/scopes/default/ca/certificate.pem"
+            )
+            assert obj["Body"].read() == b"scoped"
+
+            # The v1 cert is still cleaned up, even though nothing was copied
+            from botocore.exceptions import ClientError
+
+            with pytest.raises(ClientError):
+                ctx.s3.get_object(Bucket="test-bucket", Key="test/ca/certificate.pem")
+
 
 # =============================================================================
 # Tests: Local Key Migration
@@ -376,6 +415,36 @@ class TestMigrateLocalKey:
             new_path = paths_mod.data_dir() / "test" / "scopes" / "default" / "ca-private-key.pem"
             assert new_path.exists()
             assert new_path.read_text() == SAMPLE_CA_KEY
+            assert new_path.stat().st_mode & 0o777 == 0o600
+
+    def test_moves_key_across_filesystems(self, aws_credentials, temp_xdg_dirs) -> None:
+        """If rename fails (cross-device), the key is copied and the old one removed."""
+        import iam_ra_cli.lib.paths as paths_mod
+
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=False)
+            old_path = setup_v1_local_key(temp_xdg_dirs / "data")
+
+            with (
+                patch(
+                    "iam_ra_cli.workflows.migrate.update_role_stack",
+                    return_value=Ok(None),
+                ),
+                patch(
+                    "iam_ra_cli.workflows.migrate.migrate_ca_stack",
+                    return_value=Ok(MIGRATED_TA_ARN),
+                ),
+                patch.object(Path, "replace", side_effect=OSError(18, "Invalid cross-device link")),
+            ):
+                result = migrate(ctx, "test")
+
+            assert isinstance(result, Ok)
+            assert result.value.local_key_migrated
+            new_path = paths_mod.data_dir() / "test" / "scopes" / "default" / "ca-private-key.pem"
+            assert new_path.read_text() == SAMPLE_CA_KEY
+            assert new_path.stat().st_mode & 0o777 == 0o600
+            assert not old_path.exists()
 
     def test_deletes_old_key(self, aws_credentials, temp_xdg_dirs) -> None:
         """Old key path should be deleted after migration."""
@@ -400,6 +469,24 @@ class TestMigrateLocalKey:
 
             assert not old_path.exists()
 
+    def test_s3_failure_leaves_old_key(self, aws_credentials, temp_xdg_dirs) -> None:
+        """If the S3 cert copy fails, migrate aborts before moving the local key."""
+        from iam_ra_cli.lib.errors import S3WriteError
+
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=False)
+            old_path = setup_v1_local_key(temp_xdg_dirs / "data")
+
+            with patch(
+                "iam_ra_cli.workflows.migrate.copy_object",
+                return_value=Err(S3WriteError("test-bucket", "key", "denied")),
+            ):
+                result = migrate(ctx, "test")
+
+            assert isinstance(result, Err)
+            assert old_path.read_text() == SAMPLE_CA_KEY
+
     def test_skips_local_if_already_migrated(self, aws_credentials, temp_xdg_dirs) -> None:
         """If new path exists and old doesn't, skip local migration."""
         import iam_ra_cli.lib.paths as paths_mod
@@ -474,6 +561,35 @@ class TestMigrateRoleStacks:
             assert captured_calls[0]["trust_anchor_arn"] == MIGRATED_TA_ARN
             assert captured_calls[0]["scope"] == "default"
 
+    def test_only_fanout_client_retries_adaptively(self, aws_credentials, temp_xdg_dirs) -> None:
+        """Role updates run on a CFN client with adaptive retries; ctx's own clients don't."""
+        fanout_ctxs = []
+
+        def fake_update(ctx, namespace, name, trust_anchor_arn, policies, scope):
+            fanout_ctxs.append(ctx)
+            return Ok(None)
+
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=True)
+
+            with (
+                patch(
+                    "iam_ra_cli.workflows.migrate.update_role_stack",
+                    side_effect=fake_update,
+                ),
+                patch(
+                    "iam_ra_cli.workflows.migrate.migrate_ca_stack",
+                    return_value=Ok(MIGRATED_TA_ARN),
+                ),
+            ):
+                migrate(ctx, "test")
+
+            [fanout] = fanout_ctxs
+            assert fanout.session is ctx.session
+            assert fanout.cfn.meta.config.retries["mode"] == "adaptive"
+            assert ctx.cfn.meta.config.retries["mode"] != "adaptive"
+
     def test_passes_correct_trust_anchor(self, aws_credentials, temp_xdg_dirs) -> None:
         """Should pass the migrated scope's trust anchor ARN to role stack update."""
         captured_ta = {}
@@ -697,6 +813,37 @@ class TestMigrateRoleStacks:
             assert "admin" in result.value.roles_updated
             assert "orphan" not in result.value.roles_updated
 
+    def test_returns_error_from_failed_role_update(self, aws_credentials, temp_xdg_dirs) -> None:
+        """A failed role stack update should fail the migration without saving state."""
+        from iam_ra_cli.lib.errors import StackDeployError
+
+        deploy_error = StackDeployError("iam-ra-test-role-admin", "FAILED", "boom")
+
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=True)
+            setup_v1_local_key(temp_xdg_dirs / "data")
+
+            with (
+                patch(
+                    "iam_ra_cli.workflows.migrate.update_role_stack",
+                    return_value=Err(deploy_error),
+                ),
+                patch(
+                    "iam_ra_cli.workflows.migrate.migrate_ca_stack",
+                    return_value=Ok(MIGRATED_TA_ARN),
+                ),
+            ):
+                result = migrate(ctx, "test")
+
+            assert isinstance(result, Err)
+            assert result.error == deploy_error
+
+            # State is still in v1 format
+            response = ctx.s3.get_object(Bucket="test-bucket", Key="test/state.json")
+            raw = json.loads(response["Body"].read().decode())
+            assert raw["version"] == "1.0.0"
+
 
 # =============================================================================
 # Tests: CA Stack Migration
@@ -957,6 +1104,63 @@ class TestMigrateIdempotency:
             assert not result2.value.s3_migrated
             assert not result2.value.local_key_migrated
 
+    def test_second_run_skips_migrated_roles(self, aws_credentials, temp_xdg_dirs) -> None:
+        """Roles recorded as v2 after the first run should not be redeployed."""
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=True)
+            setup_v1_local_key(temp_xdg_dirs / "data")
+
+            with (
+                patch(
+                    "iam_ra_cli.workflows.migrate.update_role_stack",
+                    return_value=Ok(None),
+                ) as mock_update,
+                patch(
+                    "iam_ra_cli.workflows.migrate.migrate_ca_stack",
+                    return_value=Ok(MIGRATED_TA_ARN),
+                ),
+            ):
+                result1 = migrate(ctx, "test")
+                state_module.invalidate_cache("test")
+                result2 = migrate(ctx, "test")
+
+            assert isinstance(result1, Ok)
+            assert result1.value.roles_updated == ["admin"]
+            assert isinstance(result2, Ok)
+            assert result2.value.roles_updated == []
+            assert mock_update.call_count == 1
+
+            obj = ctx.s3.get_object(Bucket="test-bucket", Key="test/state.json")
+            saved = json.loads(obj["Body"].read())
+            assert saved["roles"]["admin"]["schema_version"] == 2
+
+    def test_second_run_does_not_resave_state(self, aws_credentials, temp_xdg_dirs) -> None:
+        """A run that changes nothing should not write state back."""
+        with mock_aws():
+            ctx = AwsContext(region="ap-southeast-2")
+            setup_v1_in_aws(ctx, with_roles=True)
+            setup_v1_local_key(temp_xdg_dirs / "data")
+
+            with (
+                patch(
+                    "iam_ra_cli.workflows.migrate.update_role_stack",
+                    return_value=Ok(None),
+                ),
+                patch(
+                    "iam_ra_cli.workflows.migrate.migrate_ca_stack",
+                    return_value=Ok(MIGRATED_TA_ARN),
+                ),
+            ):
+                result1 = migrate(ctx, "test")
+                state_module.invalidate_cache("test")
+                with patch.object(state_module, "save", wraps=state_module.save) as mock_save:
+                    result2 = migrate(ctx, "test")
+
+            assert isinstance(result1, Ok)
+            assert isinstance(result2, Ok)
+            mock_save.assert_not_called()
+
 
 # =============================================================================
 # Tests: Error Cases
@@ -0,0 +1,35 @@
+"""Tests for workflows/status.py - namespace status."""
+
+import json
+from dataclasses import asdict
+
+from iam_ra_cli.commands.common import to_json
+from iam_ra_cli.workflows.status import get_status
+
+
+class TestGetStatus:
+    """Tests for get_status workflow."""
+
+    def test_uninitialized_namespace(self, mock_aws_context) -> None:
+        ctx, _ = mock_aws_context
+
+        status = get_status(ctx, "nonexistent")
+
+        assert status.namespace == "nonexistent"
+        assert status.region == "ap-southeast-2"
+        assert status.initialized is False
+        assert status.init is None
+        assert status.ca is None
+        assert dict(status.cas) == {}
+        assert dict(status.roles) == {}
+        assert dict(status.hosts) == {}
+
+    def test_uninitialized_status_serializes(self, mock_aws_context) -> None:
+        ctx, _ = mock_aws_context
+
+        status = get_status(ctx, "nonexistent")
+
+        assert asdict(status)["roles"] == {}
+        payload = json.loads(to_json(status))
+        assert payload["initialized"] is False
+        assert payload["cas"] == payload["roles"] == payload["hosts"] == {}